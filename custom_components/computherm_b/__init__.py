@@ -3,14 +3,12 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 
-from custom_components.computherm_b.const import COORDINATOR, DOMAIN
-from custom_components.computherm_b.coordinator import \
-    ComputhermDataUpdateCoordinator
+from custom_components.computherm_b.coordinator import (
+    ComputhermConfigEntry, ComputhermDataUpdateCoordinator)
 
 # ANSI color codes
 BLUE = '\033[94m'
@@ -32,22 +30,35 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': BOLD_RED
     }
 
+    def __init__(self, fmt: str) -> None:
+        """Build one plain formatter per level with the colors baked into the format string."""
+        super().__init__(fmt)
+        self._level_formatters = {
+            level: logging.Formatter(
+                fmt.replace("%(levelname)s", f"{color}%(levelname)s{RESET}")
+                .replace("%(message)s", f"{color}%(message)s{RESET}"))
+            for level, color in self.COLORS.items()
+        }
+
     def format(self, record):
-        """Format log record with colors."""
-        color = self.COLORS.get(record.levelname, RESET)
-        record.levelname = f"{color}{record.levelname}{RESET}"
-        record.msg = f"{color}{record.msg}{RESET}"
-        return super().format(record)
+        """Format log record with colors, without mutating the shared record."""
+        formatter = self._level_formatters.get(record.levelname)
+        if formatter is None:
+            return super().format(record)
+        return formatter.format(record)
 
 
-# Set up custom logging format to include package name and filename with colors
-_formatter = ColoredFormatter(
-    '%(asctime)s %(levelname)s [%(name)s.%(filename)s] %(message)s')
+# Set up custom logging format to include package name and filename, colored only on a terminal
+_LOG_FORMAT = '%(asctime)s %(levelname)s [%(name)s.%(filename)s] %(message)s'
 _handler = logging.StreamHandler()
-_handler.setFormatter(_formatter)
+_handler.setFormatter(
+    ColoredFormatter(_LOG_FORMAT) if _handler.stream.isatty() else logging.Formatter(_LOG_FORMAT))
 _LOGGER = logging.getLogger(__package__)
 _LOGGER.addHandler(_handler)
 _LOGGER.propagate = False  # Prevent duplicate logging
+# Default to WARNING so routine messages aren't formatted; a level set through HA's logger config wins
+if _LOGGER.level == logging.NOTSET:
+    _LOGGER.setLevel(logging.WARNING)
 
 
 PLATFORMS: list[Platform] = [
@@ -57,10 +68,9 @@ PLATFORMS: list[Platform] = [
 ]
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: ComputhermConfigEntry) -> bool:
     """Set up Computherm from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-
+    coordinator: ComputhermDataUpdateCoordinator | None = None
     try:
         _LOGGER.debug("Setting up Computherm integration")
         coordinator = ComputhermDataUpdateCoordinator(
@@ -72,14 +82,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             await coordinator.async_config_entry_first_refresh()
         except ConfigEntryAuthFailed as err:
             _LOGGER.error("Authentication failed: %s", err)
+            await coordinator.async_close_session()
             raise
         except Exception as err:
             _LOGGER.error("Failed to refresh coordinator: %s", err)
+            await coordinator.async_close_session()
             raise ConfigEntryNotReady from err
 
-        hass.data[DOMAIN][entry.entry_id] = {
-            COORDINATOR: coordinator,
-        }
+        entry.runtime_data = coordinator
+
+        async def _async_close_session(_event: Event) -> None:
+            """Close the dedicated HTTP session if Home Assistant stops without unloading."""
+            await coordinator.async_close_session()
+
+        entry.async_on_unload(hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_session))
 
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
         _LOGGER.debug("Computherm integration setup completed successfully")
@@ -91,18 +108,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise
     except Exception as error:
         _LOGGER.exception("Unexpected error setting up integration: %s", error)
+        # Don't leave the WebSocket client and HTTP session running across setup retries
+        if coordinator is not None:
+            await coordinator.async_stop()
+            await coordinator.async_close_session()
         raise ConfigEntryNotReady from error
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: ComputhermConfigEntry) -> bool:
     """Unload a config entry."""
     try:
-        coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
+        coordinator = entry.runtime_data
 
         if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
             # Stop the coordinator's WebSocket connection and clear data
             await coordinator.async_stop()
-            hass.data[DOMAIN].pop(entry.entry_id)
+            await coordinator.async_close_session()
             _LOGGER.debug("Computherm integration unloaded successfully")
 
         return unload_ok
@@ -3,22 +3,27 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Final, Optional
+from typing import Any, Final, Mapping, NamedTuple, Optional
 
+import orjson
+from aiohttp import ClientError
+from homeassistant.components import persistent_notification
 from homeassistant.components.climate import (ClimateEntity,
                                               ClimateEntityFeature, HVACAction,
                                               HVACMode)
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (API_BASE_URL, API_DEVICE_CONTROL_ENDPOINT, COORDINATOR,
-                    DOMAIN)
+from .const import DOMAIN, EMPTY_DATA, JSON_HEADERS, SIGNAL_DEVICE_READY
 from .const import DeviceAttributes as DA
-from .coordinator import ComputhermDataUpdateCoordinator
+from .coordinator import (ComputhermConfigEntry,
+                          ComputhermDataUpdateCoordinator, build_control_url,
+                          build_device_info, has_on_off_relay)
 
 _LOGGER = logging.getLogger(__package__)
 
@@ -26,20 +31,77 @@ SUPPORT_FLAGS: Final = (
     ClimateEntityFeature.TARGET_TEMPERATURE
 )
 
+# Quiet period before a target temperature is sent, so dragging the slider posts only the final value
+SET_POINT_DEBOUNCE_SECONDS: Final = 0.3
+
+# Available HVAC modes, shared by all entities of the same relay type
+HVAC_MODES_ON_OFF: Final[list[HVACMode]] = [
+    HVACMode.OFF, HVACMode.AUTO, HVACMode.FAN_ONLY]
+HVAC_MODES_THERMOSTAT: Final[list[HVACMode]] = [
+    HVACMode.OFF, HVACMode.AUTO, HVACMode.HEAT, HVACMode.COOL]
+
+# Device modes that decide the HVAC mode on their own
+HVAC_MODE_BY_DEVICE_MODE: Final[dict[str | None, HVACMode]] = {
+    "off": HVACMode.OFF,
+    "schedule": HVACMode.AUTO,
+}
+
+# HVAC mode to (command key, command value) for the device control API
+HVAC_MODE_COMMANDS: Final[dict[HVACMode, tuple[str, str]]] = {
+    HVACMode.OFF: ("mode", "OFF"),
+    HVACMode.AUTO: ("mode", "SCHEDULE"),
+    HVACMode.HEAT: ("function", "HEATING"),
+    HVACMode.COOL: ("function", "COOLING"),
+}
+# ON-OFF relays also accept FAN_ONLY, which switches the relay to manual mode
+HVAC_MODE_COMMANDS_ON_OFF: Final[dict[HVACMode, tuple[str, str]]] = {
+    **HVAC_MODE_COMMANDS,
+    HVACMode.FAN_ONLY: ("mode", "MANUAL"),
+}
+
+
+class ThermostatState(NamedTuple):
+    """Thermostat state parsed from the coordinator's device data."""
+
+    online: bool
+    on_off: bool
+    mode: str | None
+    function: str | None
+    relay_state: bool
+    current_temperature: float | None
+    target_temperature: float | None
+    humidity: float | None
+
+    @classmethod
+    def from_device_data(cls, data: Mapping[str, Any], on_off: bool) -> ThermostatState:
+        """Build the state from a device data dictionary and its cached relay type."""
+        # Use current_temperature which is determined from the controlling sensor,
+        # fall back to DA.TEMPERATURE for backward compatibility
+        current_temperature = data.get(DA.CURRENT_TEMPERATURE)
+        if current_temperature is None:
+            current_temperature = data.get(DA.TEMPERATURE)
+        return cls(
+            online=data.get(DA.ONLINE, False),
+            on_off=on_off,
+            mode=data.get(DA.MODE),
+            function=data.get(DA.FUNCTION),
+            relay_state=data.get(DA.RELAY_STATE, False),
+            current_temperature=current_temperature,
+            target_temperature=data.get(DA.TARGET_TEMPERATURE),
+            humidity=data.get(DA.HUMIDITY),
+        )
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: ComputhermConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Computherm climate platform."""
-    coordinator: ComputhermDataUpdateCoordinator = hass.data[
-        DOMAIN][config_entry.entry_id][COORDINATOR]
+    coordinator = config_entry.runtime_data
 
-    _LOGGER.info("Setting up Computherm climate platform")
-
-    # Wait for devices to be fetched
-    await coordinator.async_config_entry_first_refresh()
+    # The first refresh has already been awaited in __init__.async_setup_entry
+    # before platforms are forwarded, so devices are known at this point.
 
     existing_entities = set()  # Track entities we've already added
 
@@ -49,46 +111,45 @@ async def async_setup_entry(
         if device_id in existing_entities:
             return
 
-        if device_id not in coordinator.devices_with_base_info:
-            _LOGGER.debug("[%s] Device has no base_info yet", device_id)
+        if not coordinator.is_device_ready(device_id):
             return
 
-        if not coordinator.devices_with_base_info[device_id]:
-            _LOGGER.debug("[%s] Device has empty base_info", device_id)
-            return
-
-        _LOGGER.info("[%s] Creating climate entity", device_id)
         entity = ComputhermThermostat(coordinator, device_id)
         async_add_entities([entity], True)
         existing_entities.add(device_id)
         _LOGGER.info("[%s] Climate entity created", device_id)
 
-    # Add entities for devices that already have base_info
+    # Add entities for devices that already have base_info; the helper skips the rest
     for serial in coordinator.devices:
-        _LOGGER.debug("[%s] Checking device for base_info", serial)
-        if serial in coordinator.devices_with_base_info and coordinator.devices_with_base_info[
-                serial]:
-            _LOGGER.info("[%s] Found existing base_info", serial)
-            _async_add_entities_for_device(serial)
+        _async_add_entities_for_device(serial)
 
-    @callback
-    def async_handle_coordinator_update() -> None:
-        """Handle updated data from the coordinator."""
-        for device_id in coordinator.devices:
-            if device_id in coordinator.devices_with_base_info and coordinator.devices_with_base_info[
-                    device_id]:
-                _async_add_entities_for_device(device_id)
-
-    # Register listener
+    # Add entities for devices that receive base_info later
     config_entry.async_on_unload(
-        coordinator.async_add_listener(async_handle_coordinator_update)
-    )
-    _LOGGER.info("Climate platform setup completed")
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_DEVICE_READY.format(entry_id=config_entry.entry_id),
+            _async_add_entities_for_device))
+    _LOGGER.info(
+        "Climate platform setup completed with %d of %d devices ready",
+        len(existing_entities), len(coordinator.devices))
 
 
 class ComputhermThermostat(CoordinatorEntity, ClimateEntity):
     """Representation of a Computherm Thermostat."""
 
+    # The Home Assistant base classes keep a __dict__ for _attr_* state;
+    # slotting our own per-instance fields keeps them out of it.
+    __slots__ = (
+        "serial_number",
+        "api_device_id",
+        "_thermostat_state",
+        "_control_url",
+        "_relays",
+        "_on_off_relay",
+        "_pending_set_point",
+        "_set_point_debouncer",
+    )
+
     _attr_has_entity_name = True
     _attr_translation_key = DOMAIN
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -104,169 +165,165 @@ class ComputhermThermostat(CoordinatorEntity, ClimateEntity):
         """Initialize the thermostat."""
         super().__init__(coordinator)
         self.serial_number = serial
-        self._setup_device_info()
+        # Look the device up once and hand the dicts to the setup helpers
+        device_data = coordinator.device_data.get(serial, EMPTY_DATA)
+        device = coordinator.devices[serial]
+        # Relay type, recomputed only when base_info replaces the relays dict
+        self._relays = device_data.get("relays")
+        self._on_off_relay = has_on_off_relay(device_data)
+        # Latest requested set point, shown as the target until it has been posted
+        self._pending_set_point: float | None = None
+        self._set_point_debouncer: Debouncer | None = None
+        # Parsed device state, refreshed once per coordinator update
+        self._thermostat_state = self._parse_state(device_data)
+        self._setup_device_info(device, device_data)
+        self._update_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Create the set point debouncer once hass is available."""
+        await super().async_added_to_hass()
+        self._set_point_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=SET_POINT_DEBOUNCE_SECONDS,
+            immediate=False,
+            function=self._async_send_debounced_set_point,
+        )
+        self.async_on_remove(self._set_point_debouncer.async_shutdown)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator.
 
-        Only update if our device's data is in the update to avoid
-        unnecessary updates when other devices change.
+        Only write state when our device's parsed state actually changed, so
+        updates for other devices don't trigger a state write here.
         """
-        # Only update if our device is in the coordinator data
-        if self.serial_number in self.coordinator.data:
+        # Skip updates that didn't touch our device
+        if self.serial_number in self.coordinator.last_updated_serials:
+            relays = self._relays
+            state = self._parse_state(
+                self.coordinator.device_data.get(self.serial_number, EMPTY_DATA))
+            # New relays can change the temperature limits even when the state is the same
+            if state == self._thermostat_state and relays is self._relays:
+                return
+            self._thermostat_state = state
+            self._update_state()
             super()._handle_coordinator_update()
 
-    def _setup_device_info(self) -> None:
+    def _parse_state(self, device_data: Mapping[str, Any]) -> ThermostatState:
+        """Parse the device data, walking the relays only when they were replaced."""
+        relays = device_data.get("relays")
+        if relays is not self._relays:
+            self._relays = relays
+            self._on_off_relay = has_on_off_relay(device_data)
+            self._setup_temperature_limits(device_data)
+        return ThermostatState.from_device_data(device_data, self._on_off_relay)
+
+    def _setup_device_info(
+            self, device: Mapping[str, Any], device_data: Mapping[str, Any]) -> None:
         """Set up device information and entity attributes."""
         # Get the API ID from devices dictionary
-        self.api_device_id = self.coordinator.devices[self.serial_number].get(
-            DA.DEVICE_ID)
+        self.api_device_id = device.get(DA.DEVICE_ID)
         if not self.api_device_id:
             raise HomeAssistantError(
                 f"No API device ID found for serial number {self.serial_number}")
+        self._control_url = build_control_url(self.api_device_id)
 
         # Get min/max temperature from relays config
-        self._setup_temperature_limits()
+        self._setup_temperature_limits(device_data)
 
         # Set unique ID and device info
-        self._setup_entity_info()
+        self._setup_entity_info(device_data)
 
         # Set up device info dictionary
-        self._setup_device_info_dict()
-
-    def _setup_temperature_limits(self) -> None:
-        """Set up min and max temperature limits from relay configs."""
-        relays = self.coordinator.device_data[self.serial_number].get(
-            "relays", {})
-        first_relay = next(iter(relays.values()), {})
-        configs = first_relay.get("configs", {})
-        self._attr_min_temp = configs.get("setpoint_min", 5)
-        self._attr_max_temp = configs.get("setpoint_max", 30)
-
-    def _setup_entity_info(self) -> None:
+        self._setup_device_info_dict(device)
+
+    def _setup_temperature_limits(self, device_data: Mapping[str, Any]) -> None:
+        """Set up min and max temperature limits from the first relay's configs.
+
+        Runs at setup and again only when base_info replaces the relays dict.
+        """
+        relays = device_data.get("relays")
+        first_relay = next(iter(relays.values()), None) if relays else None
+        configs = (first_relay.get("configs") if first_relay else None) or EMPTY_DATA
+        # The API reports whole-degree limits as ints; keep them float like the readings
+        self._attr_min_temp = float(configs.get("setpoint_min", 5))
+        self._attr_max_temp = float(configs.get("setpoint_max", 30))
+
+    def _setup_entity_info(self, device_data: Mapping[str, Any]) -> None:
         """Set up entity ID and name."""
-        entity_name = self.coordinator.device_data[self.serial_number].get(
-            "base_info", {}).get("name", "thermostat")
+        entity_name = (device_data.get("base_info") or EMPTY_DATA).get("name", "thermostat")
         self._attr_unique_id = f"{DOMAIN}_{self.serial_number}_{entity_name}"
         self._attr_name = entity_name
-        _LOGGER.info(
-            "[%s] Initializing climate entity - ID: %s",
-            self.serial_number,
-            self._attr_unique_id
-        )
 
-    def _setup_device_info_dict(self) -> None:
+    def _setup_device_info_dict(self, device: Mapping[str, Any]) -> None:
         """Set up the device info dictionary."""
-        device_info = {
-            "identifiers": {(DOMAIN, self.serial_number)},
-            "serial_number": self.serial_number,
-            "name": f"Computherm {self.serial_number}",
-            "manufacturer": "Computherm",
-            "model": self.coordinator.devices[self.serial_number].get(DA.DEVICE_TYPE, "") or "B Series Thermostat",
-            "sw_version": self.coordinator.devices[self.serial_number].get(DA.FW_VERSION),
-            "hw_version": self.coordinator.devices[self.serial_number].get("type"),
-        }
-        _LOGGER.info(
-            "[%s] Climate entity - name: %s, Info: %s",
-            self.serial_number,
-            self._attr_name,
-            device_info
-        )
+        device_info = build_device_info(self.serial_number, device)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[%s] Initializing climate entity - ID: %s, name: %s, Info: %s",
+                self.serial_number,
+                self._attr_unique_id,
+                self._attr_name,
+                device_info
+            )
         self._attr_device_info = device_info
 
-    def _has_on_off_relay(self) -> bool:
-        """Check if device has an ON-OFF relay."""
-        relays = self.device_data.get("relays", {})
-        return any(relay.get("type") == "ON-OFF" for relay in relays.values())
-
     @property
-    def hvac_modes(self) -> list[HVACMode]:
-        """Return the list of available operation modes."""
-        modes = [HVACMode.OFF, HVACMode.AUTO]
-        if self._has_on_off_relay():
-            modes.append(HVACMode.FAN_ONLY)
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._attr_available
+
+    def _update_state(self) -> None:
+        """Derive entity attributes from the parsed thermostat state."""
+        state = self._thermostat_state
+        hvac_mode = self._determine_hvac_mode(
+            state.online, state.on_off, state.mode, state.function)
+
+        self._attr_available = state.online
+        self._attr_hvac_modes = HVAC_MODES_ON_OFF if state.on_off else HVAC_MODES_THERMOSTAT
+        self._attr_hvac_mode = hvac_mode
+        if not state.online or hvac_mode == HVACMode.OFF:
+            self._attr_hvac_action = HVACAction.OFF
         else:
-            modes.extend([HVACMode.HEAT, HVACMode.COOL])
-        return modes
-
-    @property
-    def device_data(self) -> dict:
-        """Get the current device data."""
-        return self.coordinator.device_data.get(self.serial_number, {})
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        # Use current_temperature which is determined from the controlling sensor
-        if self.device_data.get(DA.CURRENT_TEMPERATURE) is not None:
-            return float(self.device_data[DA.CURRENT_TEMPERATURE])
-        # Fallback to DA.TEMPERATURE for backward compatibility
-        elif self.device_data.get(DA.TEMPERATURE) is not None:
-            return float(self.device_data[DA.TEMPERATURE])
-        return None
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
-        if self.device_data.get(DA.TARGET_TEMPERATURE) is not None:
-            return float(self.device_data[DA.TARGET_TEMPERATURE])
-        return None
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return the current operation mode."""
-        if not self.device_data.get(DA.ONLINE, False):
+            self._attr_hvac_action = self._determine_hvac_action(
+                state.on_off, state.function, state.relay_state)
+
+        # Readings are stored as floats (or None) by the WebSocket handler
+        self._attr_current_temperature = state.current_temperature
+        # Keep showing a requested set point until it has been posted
+        pending = self._pending_set_point
+        self._attr_target_temperature = state.target_temperature if pending is None else pending
+        humidity = state.humidity
+        self._attr_current_humidity = round(humidity) if humidity is not None else None
+
+    @staticmethod
+    def _determine_hvac_mode(
+            online: bool,
+            on_off: bool,
+            mode: str | None,
+            function: str | None) -> HVACMode:
+        """Determine the current HVAC mode from the device state."""
+        if not online:
             return HVACMode.OFF
 
-        if self._has_on_off_relay():
-            mode = self.device_data.get(DA.MODE)
-            if mode == "off":
-                return HVACMode.OFF
-            elif mode == "schedule":
-                return HVACMode.AUTO
-            else:  # mode == "manual" or missing
-                return HVACMode.FAN_ONLY
+        # OFF and SCHEDULE map the same way for every relay type
+        hvac_mode = HVAC_MODE_BY_DEVICE_MODE.get(mode)
+        if hvac_mode is not None:
+            return hvac_mode
 
-        mode = self.device_data.get(DA.MODE)
-
-        # If mode is SCHEDULE, return AUTO
-        if mode == "schedule":
-            return HVACMode.AUTO
-
-        # If mode is OFF, return OFF
-        if mode == "off":
-            return HVACMode.OFF
-
-        # Otherwise, determine based on function (MANUAL mode)
-        function = self.device_data.get(DA.FUNCTION)
+        # MANUAL (or missing) mode: ON-OFF relays are fan-only, thermostats follow the function
+        if on_off:
+            return HVACMode.FAN_ONLY
         return HVACMode.COOL if function == "cooling" else HVACMode.HEAT
 
-    @property
-    def hvac_action(self) -> HVACAction | None:
-        """Return the current running hvac operation."""
-        if not self._is_device_active():
-            return HVACAction.OFF
-
-        function = self.device_data.get(DA.FUNCTION)
-        relay_state = self.device_data.get(DA.RELAY_STATE, False)
-
-        return self._determine_hvac_action(function, relay_state)
-
-    def _is_device_active(self) -> bool:
-        """Check if the device is active and operational."""
-        if not self.device_data.get(DA.ONLINE, False):
-            return False
-        if self.hvac_mode == HVACMode.OFF:
-            return False
-        return True
-
+    @staticmethod
     def _determine_hvac_action(
-            self,
+            on_off: bool,
             function: str | None,
             relay_state: bool) -> HVACAction:
         """Determine the current HVAC action based on function and relay state."""
-        if self._has_on_off_relay():
+        if on_off:
             return HVACAction.FAN if relay_state else HVACAction.IDLE
 
         if function == "cooling":
@@ -274,116 +331,73 @@ class ComputhermThermostat(CoordinatorEntity, ClimateEntity):
 
         return HVACAction.HEATING if relay_state else HVACAction.IDLE
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.device_data.get(DA.ONLINE, False)
-
-    @property
-    def current_humidity(self) -> int | None:
-        """Return the current humidity."""
-        if self.device_data.get(DA.HUMIDITY) is not None:
-            return round(float(self.device_data[DA.HUMIDITY]))
-        return None
-
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
 
+        # Quantize to the 0.1°C step and clamp so the API never rejects the set point
+        set_point = round(temperature * 10) / 10
+        set_point = min(max(set_point, self._attr_min_temp), self._attr_max_temp)
+
+        # Show the new set point right away; only the last one in a burst is posted
+        self._pending_set_point = set_point
+        self._attr_target_temperature = set_point
+        self.async_write_ha_state()
+        if self._set_point_debouncer is None:
+            # Not added to hass yet, so there is nothing to debounce; errors reach the caller
+            await self._async_send_set_point()
+            return
+        await self._set_point_debouncer.async_call()
+
+    async def _async_send_set_point(self) -> None:
+        """Post the requested target temperature until no newer one is pending."""
+        while (set_point := self._pending_set_point) is not None:
+            try:
+                await self._async_post_control(
+                    {
+                        "relay": 1,
+                        "manual_set_point": set_point,
+                    },
+                    f"target temperature to {set_point:.1f}°C",
+                )
+            except HomeAssistantError:
+                # Put the displayed set point back to the device's value
+                self._pending_set_point = None
+                self._update_state()
+                self.async_write_ha_state()
+                raise
+            # A set point requested while posting is sent on the next pass
+            if self._pending_set_point == set_point:
+                self._pending_set_point = None
+
+    async def _async_send_debounced_set_point(self) -> None:
+        """Post the set point from the debouncer and report failures to the user.
+
+        The service call has already returned by the time the debouncer fires,
+        so a failure is raised as a persistent notification instead.
+        """
         try:
-            await self._send_temperature_command(temperature)
-        except Exception as error:
-            _LOGGER.error(
-                "Failed to set temperature for device %s (API ID: %s): %s",
-                self.serial_number,
-                self.api_device_id,
-                error
+            await self._async_send_set_point()
+        except HomeAssistantError as error:
+            persistent_notification.async_create(
+                self.hass,
+                str(error),
+                title=f"Computherm {self.serial_number}: set point not applied",
+                notification_id=f"{DOMAIN}_{self.serial_number}_set_point",
             )
-            raise HomeAssistantError(
-                f"Failed to set temperature: {error}") from error
-
-    async def _send_temperature_command(self, temperature: float) -> None:
-        """Send temperature change command to the device."""
-        _LOGGER.info(
-            "[%s] Setting temperature to %.1f°C (API ID: %s)",
-            self.serial_number,
-            temperature,
-            self.api_device_id
-        )
-
-        request_data = {
-            "relay": 1,
-            "manual_set_point": round(float(temperature), 1),
-        }
-
-        _LOGGER.debug(
-            "[%s] Sending target temperature change request: %s",
-            self.serial_number,
-            request_data
-        )
-
-        async with self.coordinator.session.post(
-            f"{API_BASE_URL}{API_DEVICE_CONTROL_ENDPOINT.format(device_id=self.api_device_id)}",
-            headers={"Authorization": f"Bearer {self.coordinator.auth_token}"},
-            json=request_data,
-        ) as response:
-            response_data = await response.json()
-            response.raise_for_status()
-
-            _LOGGER.info(
-                "[%s] Successfully set target temperature to %.1f°C",
-                self.serial_number,
-                temperature
-            )
-            await self.coordinator.async_request_refresh()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new operation mode."""
-        try:
-            operation_mode = self._get_operation_mode(hvac_mode)
-            if operation_mode is None:
-                _LOGGER.error("Invalid HVAC mode: %s", hvac_mode)
-                return
-
-            await self._send_hvac_mode_command(operation_mode)
-        except Exception as error:
-            _LOGGER.error(
-                "Failed to set operation mode for device %s (API ID: %s): %s",
-                self.serial_number,
-                self.api_device_id,
-                error
-            )
-            raise HomeAssistantError(
-                f"Failed to set HVAC mode: {error}") from error
-
-    def _get_operation_mode(
-            self, hvac_mode: HVACMode) -> Optional[tuple[str, str]]:
-        """Get operation mode parameters based on HVAC mode."""
-        if hvac_mode == HVACMode.FAN_ONLY:
-            if self._has_on_off_relay():
-                return ("mode", "MANUAL")
-            return None
-
-        mode_map = {
-            HVACMode.OFF: ("mode", "OFF"),
-            HVACMode.AUTO: ("mode", "SCHEDULE"),
-            HVACMode.HEAT: ("function", "HEATING"),
-            HVACMode.COOL: ("function", "COOLING"),
-        }
-        return mode_map.get(hvac_mode)
+        # Work from one parsed state snapshot for the whole command
+        state = self._thermostat_state
+        operation_mode = self._get_operation_mode(hvac_mode, state)
+        if operation_mode is None:
+            _LOGGER.error("Invalid HVAC mode: %s", hvac_mode)
+            return
 
-    async def _send_hvac_mode_command(
-            self, operation_mode: tuple[str, str]) -> None:
-        """Send HVAC mode change command to the device."""
         operation, mode = operation_mode
-        _LOGGER.info(
-            "[%s] Setting operation mode to %s",
-            self.serial_number,
-            mode
-        )
-
         request_data = {
             "relay": 1,
             operation: mode
@@ -392,26 +406,56 @@ class ComputhermThermostat(CoordinatorEntity, ClimateEntity):
         # When setting HEAT or COOL (function), also set mode to MANUAL
         if operation == "function":
             request_data["mode"] = "MANUAL"
-        elif "off" == self.device_data.get(DA.MODE):
+        elif state.mode == "off":
             request_data["mode"] = "MANUAL"
 
+        await self._async_post_control(
+            request_data, f"operation mode to {mode}")
+
+    @staticmethod
+    def _get_operation_mode(
+            hvac_mode: HVACMode, state: ThermostatState) -> Optional[tuple[str, str]]:
+        """Get operation mode parameters based on HVAC mode."""
+        commands = HVAC_MODE_COMMANDS_ON_OFF if state.on_off else HVAC_MODE_COMMANDS
+        return commands.get(hvac_mode)
+
+    async def _async_post_control(
+            self, request_data: dict[str, Any], description: str) -> None:
+        """Send a control command to the device and apply it locally on success."""
+        _LOGGER.info(
+            "[%s] Setting %s (API ID: %s)",
+            self.serial_number,
+            description,
+            self.api_device_id
+        )
         _LOGGER.debug(
-            "[%s] Sending HVAC mode change request: %s",
+            "[%s] Sending control request: %s",
             self.serial_number,
             request_data
         )
 
-        async with self.coordinator.session.post(
-            f"{API_BASE_URL}{API_DEVICE_CONTROL_ENDPOINT.format(device_id=self.api_device_id)}",
-            headers={"Authorization": f"Bearer {self.coordinator.auth_token}"},
-            json=request_data,
-        ) as response:
-            response_data = await response.json()
-            response.raise_for_status()
-
-            _LOGGER.info(
-                "[%s] Successfully set operation mode to %s",
+        try:
+            async with self.coordinator.session.post(
+                self._control_url,
+                headers=JSON_HEADERS,
+                data=orjson.dumps(request_data),
+            ) as response:
+                # The response body isn't used; the WebSocket push carries the new state
+                response.raise_for_status()
+
+                _LOGGER.info(
+                    "[%s] Successfully set %s",
+                    self.serial_number,
+                    description
+                )
+                self.coordinator.apply_control_command(self.serial_number, request_data)
+        except (ClientError, asyncio.TimeoutError) as error:
+            _LOGGER.error(
+                "Failed to set %s for device %s (API ID: %s): %s",
+                description,
                 self.serial_number,
-                mode
+                self.api_device_id,
+                error
             )
-            await self.coordinator.async_request_refresh()
+            raise HomeAssistantError(
+                f"Failed to set {description}: {error}") from error
@@ -6,29 +6,31 @@ import logging
 from typing import Any
 
 import aiohttp
+import orjson
 import voluptuous as vol
-from aiohttp import ClientTimeout
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import API_BASE_URL, API_LOGIN_ENDPOINT, DOMAIN
+from .const import DOMAIN, JSON_HEADERS, LOGIN_URL, REQUEST_TIMEOUT
 
 _LOGGER = logging.getLogger(__package__)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
-        vol.Required("username"): str,
-        vol.Required("password"): str,
+        # Strip before the length check so pasted whitespace can't reach the unique ID or the login
+        vol.Required("username"): vol.All(str, vol.Strip, vol.Length(min=3)),
+        # Not stripped: leading or trailing spaces may be part of the password
+        vol.Required("password"): vol.All(str, vol.Length(min=1)),
     }
 )
 
 
 async def validate_input(
-        hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
+        hass: HomeAssistant, data: dict[str, Any]) -> str:
+    """Validate the user input allows us to connect and return the entry title."""
     session = async_get_clientsession(hass)
 
     try:
@@ -38,11 +40,11 @@ async def validate_input(
         }
         _LOGGER.debug("Attempting to authenticate with Computherm API")
 
-        timeout = ClientTimeout(total=30)
         async with session.post(
-            f"{API_BASE_URL}{API_LOGIN_ENDPOINT}",
-            json=login_payload,
-            timeout=timeout,
+            LOGIN_URL,
+            data=orjson.dumps(login_payload),
+            headers=JSON_HEADERS,
+            timeout=REQUEST_TIMEOUT,
         ) as response:
             if response.status == 401:
                 _LOGGER.error("Authentication failed: Invalid credentials")
@@ -55,17 +57,17 @@ async def validate_input(
                 raise CannotConnect(f"HTTP error: {err.status}") from err
 
             try:
-                result = await response.json()
+                result = await response.json(loads=orjson.loads)
             except ValueError as err:
                 _LOGGER.error("Failed to parse API response: %s", err)
                 raise CannotConnect("Invalid API response") from err
 
-            if not result.get("token") and not result.get("access_token"):
+            if not (result.get("token") or result.get("access_token")):
                 _LOGGER.error("No authentication token in response")
                 raise CannotConnect("No authentication token received")
 
             _LOGGER.debug("Successfully authenticated with Computherm API")
-            return {"title": f"Computherm ({data['username']})"}
+            return f"Computherm ({data['username']})"
 
     except asyncio.TimeoutError as error:
         _LOGGER.error("Timeout connecting to Computherm API")
@@ -73,14 +75,14 @@ async def validate_input(
     except aiohttp.ClientConnectionError as error:
         _LOGGER.error("Failed to connect to Computherm API: %s", error)
         raise CannotConnect("Connection failed") from error
-    except InvalidAuth as error:
-        # Re-raise InvalidAuth without wrapping
-        raise
-    except CannotConnect as error:
-        # Re-raise CannotConnect without wrapping
+    except (InvalidAuth, CannotConnect):
+        # Already classified above; pass through without wrapping
         raise
     except Exception as error:
-        _LOGGER.exception("Unexpected error occurred during validation")
+        # Only format a traceback when debug logging is on
+        _LOGGER.error(
+            "Unexpected error occurred during validation: %s", error,
+            exc_info=_LOGGER.isEnabledFor(logging.DEBUG))
         raise UnknownError("Unexpected error occurred") from error
 
 
@@ -101,10 +103,10 @@ class ComputhermConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 await self.async_set_unique_id(user_input["username"])
                 self._abort_if_unique_id_configured()
 
-                info = await validate_input(self.hass, user_input)
+                title = await validate_input(self.hass, user_input)
                 _LOGGER.debug("Configuration validation successful")
                 return self.async_create_entry(
-                    title=info["title"], data=user_input)
+                    title=title, data=user_input)
 
             except CannotConnect as error:
                 _LOGGER.error("Connection failed: %s", error)
@@ -1,9 +1,20 @@
 """Constants for the Computherm integration."""
-from typing import Dict, Final, List
+from types import MappingProxyType
+from typing import Any, Dict, Final, List, Mapping
 
-# Integration domain and coordinator
+from aiohttp import ClientTimeout
+
+# Integration domain
 DOMAIN: Final[str] = "computherm_b"
-COORDINATOR: Final[str] = "coordinator"
+
+# Dispatcher signal sent once a device has received base_info, formatted with the entry ID
+SIGNAL_DEVICE_READY: Final[str] = f"{DOMAIN}_device_ready_{{entry_id}}"
+
+# Shared read-only default for missing device data, avoids allocating a dict per lookup
+EMPTY_DATA: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Headers for API requests with a pre-serialized JSON body
+JSON_HEADERS: Final[Mapping[str, str]] = MappingProxyType({"Content-Type": "application/json"})
 
 # API Configuration
 API_BASE_URL: Final[str] = "https://api.computhermbseries.com"
@@ -13,6 +24,13 @@ API_DEVICE_CONTROL_ENDPOINT: Final[str] = "/api/devices/{device_id}/cmd"
 API_WIFI_STATE_ENDPOINT: Final[str] = "/api/devices/{device_id}/cmd/wifi-state"
 API_SENSORS_ENDPOINT: Final[str] = "/api/devices/{device_id}/sensors"
 
+# Fixed API URLs, joined once at import
+LOGIN_URL: Final[str] = f"{API_BASE_URL}{API_LOGIN_ENDPOINT}"
+DEVICES_URL: Final[str] = f"{API_BASE_URL}{API_DEVICES_ENDPOINT}"
+
+# REST request timeout: fail fast on connect and stalled reads instead of aiohttp's 5 minute default
+REQUEST_TIMEOUT: Final[ClientTimeout] = ClientTimeout(total=30, connect=5, sock_read=10)
+
 # Device Types and Models
 DEVICE_TYPES: Final[Dict[str, str]] = {
     "BBOIL": "bboil-classic",
@@ -57,32 +75,13 @@ class DeviceAttributes:
     SOURCE: Final[str] = "src"
 
 
-# For backward compatibility
-ATTR_SERIAL_NUMBER = DeviceAttributes.SERIAL_NUMBER
-ATTR_DEVICE_ID = DeviceAttributes.DEVICE_ID
-ATTR_DEVICE_TYPE = DeviceAttributes.DEVICE_TYPE
-ATTR_FW_VERSION = DeviceAttributes.FW_VERSION
-ATTR_DEVICE_IP = DeviceAttributes.DEVICE_IP
-ATTR_ACCESS_STATUS = DeviceAttributes.ACCESS_STATUS
-ATTR_TEMPERATURE = DeviceAttributes.TEMPERATURE
-ATTR_HUMIDITY = DeviceAttributes.HUMIDITY
-ATTR_TARGET_TEMPERATURE = DeviceAttributes.TARGET_TEMPERATURE
-ATTR_FUNCTION = DeviceAttributes.FUNCTION
-ATTR_MODE = DeviceAttributes.MODE
-ATTR_RELAY_STATE = DeviceAttributes.RELAY_STATE
-ATTR_ONLINE = DeviceAttributes.ONLINE
-ATTR_BATTERY = DeviceAttributes.BATTERY
-ATTR_RSSI = DeviceAttributes.RSSI
-ATTR_RSSI_LEVEL = DeviceAttributes.RSSI_LEVEL
-ATTR_SOURCE = DeviceAttributes.SOURCE
-
-
 # WebSocket Configuration
 class WebSocketConfig:
     """WebSocket configuration constants."""
 
     BASE_URL: Final[str] = "wss://api.computhermbseries.com/socket.io/?EIO=4&transport=websocket"
     PING_MESSAGE: Final[str] = "3"  # Socket.IO ping message
+    HEARTBEAT_INTERVAL: Final[float] = 25.0  # Matches the Socket.IO default pingInterval
     MESSAGE_TEMPLATES: Final[Dict[str, str]] = {
         "LOGIN": '40/devices,{{"accessToken":"{access_token}"}}',
         "SUBSCRIBE": '42/devices,["subscribe",{device_ids}]',
@@ -3,22 +3,40 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Final, List, Optional
 
-from aiohttp import ClientError, ClientResponseError, ClientSession
+import orjson
+from aiohttp import (ClientError, ClientResponseError, ClientSession,
+                     TCPConnector)
+from aiohttp.hdrs import AUTHORIZATION
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import (DataUpdateCoordinator,
                                                       UpdateFailed)
 
-from .const import (API_BASE_URL, API_DEVICES_ENDPOINT, API_LOGIN_ENDPOINT,
-                    API_SENSORS_ENDPOINT, API_WIFI_STATE_ENDPOINT, DOMAIN)
+from .const import (API_BASE_URL, API_DEVICE_CONTROL_ENDPOINT,
+                    API_SENSORS_ENDPOINT, API_WIFI_STATE_ENDPOINT, DEVICES_URL,
+                    DOMAIN, JSON_HEADERS, LOGIN_URL, REQUEST_TIMEOUT,
+                    SIGNAL_DEVICE_READY)
 from .const import DeviceAttributes as DA
 from .websocket import WebSocketClient
 
 _LOGGER = logging.getLogger(__package__)
 
+# Device state kept from earlier frames when an update omits them or sends None
+PRESERVED_STATE_KEYS: Final = (DA.FUNCTION, DA.MODE, DA.CONTROLLING_SRC, DA.CONTROLLING_SENSOR)
+
+# Device registration data carried alongside base_info
+BASE_INFO_KEYS: Final = ("base_info", "available_sensor_ids", "available_relay_ids", "sensors", "relays")
+
+# Window used to coalesce bursts of WebSocket frames into a single listener update
+UPDATE_DEBOUNCE_SECONDS: Final = 0.1
+
+# Devices whose metadata is fetched at once; each makes two requests, matching the connector's per-host limit
+METADATA_FETCH_CONCURRENCY: Final = 2
+
 
 class ComputhermError(Exception):
     """Base class for Computherm integration errors."""
@@ -32,6 +50,48 @@ class ComputhermAuthError(ComputhermError):
     """Authentication error occurred."""
 
 
+def build_device_info(serial: str, device: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the Home Assistant device info dictionary for a device."""
+    get = device.get
+    return {
+        "identifiers": {(DOMAIN, serial)},
+        "serial_number": serial,
+        "name": f"Computherm {serial}",
+        "manufacturer": "Computherm",
+        "model": get(DA.DEVICE_TYPE, "") or "B Series Thermostat",
+        "sw_version": get(DA.FW_VERSION),
+        "hw_version": get("type"),
+    }
+
+
+def build_device_entry(serial: str, device: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the fields the integration uses from a device list entry."""
+    get = device.get
+    return {
+        DA.DEVICE_ID: get("id"),
+        DA.SERIAL_NUMBER: serial,
+        "brand": get("brand"),
+        "type": get("type"),
+        "user_id": get("user_id"),
+        DA.FW_VERSION: get(DA.FW_VERSION),
+        DA.DEVICE_IP: get(DA.DEVICE_IP),
+        DA.DEVICE_TYPE: get(DA.DEVICE_TYPE, ""),
+        DA.ACCESS_STATUS: get(DA.ACCESS_STATUS),
+        "access_rules": get("access_rules", {}),
+    }
+
+
+def build_control_url(api_device_id: Any) -> str:
+    """Build the command endpoint URL for a device."""
+    return f"{API_BASE_URL}{API_DEVICE_CONTROL_ENDPOINT.format(device_id=api_device_id)}"
+
+
+def has_on_off_relay(device_data: Dict[str, Any]) -> bool:
+    """Check if device data describes an ON-OFF relay."""
+    relays = device_data.get("relays", {})
+    return any(relay.get("type") == "ON-OFF" for relay in relays.values())
+
+
 class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     """Class to manage fetching Computherm data."""
 
@@ -50,28 +110,49 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             update_interval=None,
         )
         self.config_entry = config_entry
-        self.session: ClientSession = async_get_clientsession(hass)
+        # Dedicated session for the single API host: a longer keep-alive than Home
+        # Assistant's shared connector keeps the TLS connection warm between commands
+        self.session: ClientSession = ClientSession(
+            connector=TCPConnector(
+                limit_per_host=4,
+                keepalive_timeout=120,
+                ttl_dns_cache=600,
+                enable_cleanup_closed=True,
+            ),
+            timeout=REQUEST_TIMEOUT,
+        )
         self.auth_token: Optional[str] = None
         self.devices: Dict[str, Dict[str, Any]] = {}
         self.device_data: Dict[str, Dict[str, Any]] = {}
-        # Track devices that have received base_info
-        self.devices_with_base_info: Dict[str, Dict[str, Any]] = {}
         self._ws_client: Optional[WebSocketClient] = None
+        # Pending debounced listener update
+        self._dispatch_handle: Optional[asyncio.TimerHandle] = None
+        # Set when a device is added, so the next flush republishes coordinator data
+        self._devices_changed: bool = False
+        # Devices updated in the pending debounce window, and in the last listener update;
+        # entities ignore listener updates that do not name their device
+        self._updated_serials: set[str] = set()
+        self.last_updated_serials: frozenset[str] = frozenset()
+        # Bounds concurrent per-device metadata fetches when many devices report base_info together
+        self._metadata_semaphore = asyncio.Semaphore(METADATA_FETCH_CONCURRENCY)
+        # Initial setup shared by concurrent refresh calls
+        self._bootstrap_task: Optional[asyncio.Task] = None
         _LOGGER.info("Initialized ComputhermDataUpdateCoordinator")
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from API endpoint."""
+        # A full refresh (or its failure) is reported to every entity, not just the last flushed ones
+        self.last_updated_serials = frozenset(self.devices)
         try:
             if not self.auth_token:
-                _LOGGER.info("No auth token, starting initial setup...")
-                await self._authenticate()
-                await self._fetch_devices()
-                await self._setup_websocket()
-                _LOGGER.info("Initial setup completed successfully")
-            elif self._ws_client and not self._ws_client.websocket:
-                # Only attempt reconnect if we have a client but lost
-                # connection
-                _LOGGER.info("WebSocket disconnected, attempting reconnect...")
+                if self._bootstrap_task is None or self._bootstrap_task.done():
+                    _LOGGER.info("No auth token, starting initial setup...")
+                    self._bootstrap_task = self.hass.async_create_task(self._bootstrap())
+                await self._bootstrap_task
+            elif self._ws_client and not self._ws_client.is_running:
+                # The client backs off between reconnects on its own; only restart
+                # it if its connection task has exited
+                _LOGGER.info("WebSocket client stopped, restarting...")
                 await self._ws_client.start()
 
             return self.device_data
@@ -82,7 +163,7 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         except ClientResponseError as error:
             if error.status == 401:
                 _LOGGER.error("Authentication token expired or invalid")
-                self.auth_token = None  # Clear token to force re-authentication
+                self._clear_auth()  # Clear token to force re-authentication
                 raise ConfigEntryAuthFailed("Authentication failed") from error
             _LOGGER.error("API error: %s", error)
             raise ComputhermConnectionError(
@@ -95,26 +176,44 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             _LOGGER.exception("Unexpected error")
             raise UpdateFailed(f"Unexpected error: {str(error)}") from error
 
+    def _clear_auth(self) -> None:
+        """Forget the auth token and drop it from the session headers."""
+        self.auth_token = None
+        self.session.headers.pop(AUTHORIZATION, None)
+
+    async def _bootstrap(self) -> None:
+        """Authenticate, fetch devices and start the WebSocket client."""
+        await self._authenticate()
+        await self._fetch_devices()
+        # The client connects in the background; devices are announced over the
+        # device ready signal as their base_info arrives.
+        await self._setup_websocket()
+        _LOGGER.info("Initial setup completed successfully")
+
     async def _authenticate(self) -> None:
         """Authenticate with the API."""
         try:
             _LOGGER.info("Attempting authentication...")
+            self._clear_auth()
             async with self.session.post(
-                f"{API_BASE_URL}{API_LOGIN_ENDPOINT}",
-                json={
+                LOGIN_URL,
+                data=orjson.dumps({
                     "email": self.config_entry.data["username"],
                     "password": self.config_entry.data["password"],
-                },
+                }),
+                headers=JSON_HEADERS,
             ) as resp:
                 if resp.status == 401:
                     raise ComputhermAuthError("Invalid credentials")
                 resp.raise_for_status()
-                result = await resp.json()
+                result = await resp.json(loads=orjson.loads)
                 self.auth_token = result.get(
                     "token") or result.get("access_token")
                 if not self.auth_token:
                     raise ComputhermAuthError(
                         "No authentication token received")
+                # Every later request on the dedicated session carries the token
+                self.session.headers[AUTHORIZATION] = f"Bearer {self.auth_token}"
                 _LOGGER.info("Authentication successful")
         except ClientResponseError as error:
             if error.status == 401:
@@ -133,13 +232,12 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         try:
             _LOGGER.info("Fetching devices...")
             async with self.session.get(
-                f"{API_BASE_URL}{API_DEVICES_ENDPOINT}",
-                headers={"Authorization": f"Bearer {self.auth_token}"},
+                DEVICES_URL,
             ) as resp:
                 if resp.status == 401:
                     raise ComputhermAuthError("Invalid authentication")
                 resp.raise_for_status()
-                devices = await resp.json()
+                devices = await resp.json(loads=orjson.loads)
 
                 await self._process_devices_response(devices)
 
@@ -159,29 +257,16 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     async def _process_devices_response(
             self, devices: List[Dict[str, Any]]) -> None:
         """Process the devices response data."""
-        self.devices = {}
-        for device in devices:
-            serial = device.get(DA.SERIAL_NUMBER)
-            if serial:
-                self.devices[serial] = {
-                    DA.DEVICE_ID: device.get("id"),
-                    DA.SERIAL_NUMBER: serial,
-                    "brand": device.get("brand"),
-                    "type": device.get("type"),
-                    "user_id": device.get("user_id"),
-                    DA.FW_VERSION: device.get(DA.FW_VERSION),
-                    DA.DEVICE_IP: device.get(DA.DEVICE_IP),
-                    DA.DEVICE_TYPE: device.get(DA.DEVICE_TYPE, ""),
-                    DA.ACCESS_STATUS: device.get(DA.ACCESS_STATUS),
-                    "access_rules": device.get("access_rules", {})
-                }
-                _LOGGER.info(
-                    "Found device: %s with data: %s",
-                    serial,
-                    self.devices[serial])
-            else:
-                _LOGGER.warning(
-                    "Device without serial number found: %s", device)
+        self.devices = {
+            serial: build_device_entry(serial, device)
+            for device in devices
+            if (serial := device.get(DA.SERIAL_NUMBER))
+        }
+        if len(self.devices) != len(devices):
+            _LOGGER.warning(
+                "Skipped %d device entries with a missing or duplicate serial number",
+                len(devices) - len(self.devices))
+        _LOGGER.debug("Found devices: %s", self.devices)
 
         if not self.devices:
             _LOGGER.warning("No devices found for user")
@@ -192,6 +277,10 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 "Successfully fetched %d devices: %s", len(
                     self.devices), list(
                     self.devices.keys()))
+            # Build each device's state skeleton once so updates can mutate it in place
+            for serial in self.devices:
+                if serial not in self.device_data:
+                    self._initialize_device_data(serial)
 
     async def _setup_websocket(self) -> None:
         """Set up WebSocket connection."""
@@ -211,6 +300,7 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                     device_serials=list(self.devices.keys()),
                     data_callback=self._handle_ws_update,
                     coordinator=self,
+                    session=self.session,
                 )
                 await self._ws_client.start()
                 _LOGGER.info("WebSocket connection established successfully")
@@ -220,6 +310,37 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             raise ComputhermConnectionError(
                 f"WebSocket setup failed: {error}") from error
 
+    def is_device_ready(self, serial: str) -> bool:
+        """Check if a device has received base_info and is ready for entity creation."""
+        if not self._has_base_info(serial):
+            _LOGGER.debug("[%s] Device has no base_info yet", serial)
+            return False
+        return True
+
+    def _has_base_info(self, serial: str) -> bool:
+        """Return whether base_info has been stored for a device."""
+        device = self.device_data.get(serial)
+        return bool(device and device.get("base_info"))
+
+    def apply_control_command(self, serial: str, command: Dict[str, Any]) -> None:
+        """Optimistically apply an accepted control command to the local device state.
+
+        The WebSocket push that follows the command reconciles any difference.
+        Listener updates go through the same debounce as WebSocket frames, so a
+        burst of commands (e.g. dragging the target temperature) notifies once.
+        """
+        device = self.device_data.get(serial)
+        if device is None:
+            return
+
+        if "manual_set_point" in command:
+            device[DA.TARGET_TEMPERATURE] = float(command["manual_set_point"])
+        for key in (DA.MODE, DA.FUNCTION):
+            if key in command:
+                device[key] = str(command[key]).lower()
+
+        self._schedule_dispatch(serial)
+
     def _handle_ws_update(self, update: Dict[str, Any]) -> None:
         """Handle device updates from WebSocket."""
         try:
@@ -240,10 +361,9 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                     self._synthesize_base_info(device_serial)
                 return
 
-            # Handle device updates
-            for serial, device_data in update.items():
-                if serial in self.devices:
-                    self._process_device_update(serial, device_data)
+            # Handle device updates, skipping serials that aren't ours
+            for serial in self.devices.keys() & update.keys():
+                self._process_device_update(serial, update[serial])
 
         except Exception as error:
             _LOGGER.error("Error handling WebSocket update: %s", error)
@@ -281,9 +401,7 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             self, serial: str, device_data: Dict[str, Any]) -> None:
         """Process update data for a single device."""
         try:
-            # Initialize device_data if not exists
-            if serial not in self.device_data:
-                self._initialize_device_data(serial)
+            was_ready = self._has_base_info(serial)
 
             # Handle base_info updates
             if "base_info" in device_data:
@@ -292,9 +410,11 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             # Handle state updates
             self._process_state_update(serial, device_data)
 
-            # Notify HA of the update with a NEW dict object to trigger coordinator listeners
-            # This ensures CoordinatorEntity instances (like climate) get notified of changes
-            self.async_set_updated_data({**self.device_data})
+            # Coalesce frame bursts into one coordinator update
+            self._schedule_dispatch(serial)
+
+            if not was_ready:
+                self._async_signal_device_ready(serial)
 
         except Exception as error:
             _LOGGER.error(
@@ -302,9 +422,39 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 serial,
                 error)
 
+    def _schedule_dispatch(self, serial: str) -> None:
+        """Record an updated device and schedule a debounced listener update."""
+        self._updated_serials.add(serial)
+        if self._dispatch_handle is not None:
+            return
+        self._dispatch_handle = self.hass.loop.call_later(
+            UPDATE_DEBOUNCE_SECONDS, self._flush_updates)
+
+    def _flush_updates(self) -> None:
+        """Notify listeners of all updates received during the debounce window."""
+        self._dispatch_handle = None
+        self.last_updated_serials = frozenset(self._updated_serials)
+        self._updated_serials.clear()
+        if self._devices_changed:
+            # Publish a NEW dict object so coordinator data includes the new device
+            self._devices_changed = False
+            self.async_set_updated_data({**self.device_data})
+        else:
+            # Per-device dicts are updated in place, so listeners only need a nudge
+            self.async_update_listeners()
+
+    def _async_signal_device_ready(self, serial: str) -> None:
+        """Tell platforms that a device has received base_info."""
+        if self._has_base_info(serial):
+            async_dispatcher_send(
+                self.hass,
+                SIGNAL_DEVICE_READY.format(entry_id=self.config_entry.entry_id),
+                serial)
+
     def _initialize_device_data(self, serial: str) -> None:
         """Initialize data structure for a device."""
-        _LOGGER.info("[%s] Initializing data structure", serial)
+        _LOGGER.debug("[%s] Initializing data structure", serial)
+        self._devices_changed = True
         self.device_data[serial] = {
             **self.devices[serial],
             DA.TEMPERATURE: None,
@@ -324,47 +474,44 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     def _process_state_update(
             self, serial: str, device_data: Dict[str, Any]) -> None:
         """Process state update for a device."""
-        # Preserve existing values if not provided in update
-        preserved_keys = []
-
-        # Preserve FUNCTION if not in update
-        if device_data.get(DA.FUNCTION) is None and self.device_data[serial].get(DA.FUNCTION) is not None:
-            preserved_keys.append((DA.FUNCTION, self.device_data[serial][DA.FUNCTION]))
-
-        # Preserve MODE if not in update
-        if device_data.get(DA.MODE) is None and self.device_data[serial].get(DA.MODE) is not None:
-            preserved_keys.append((DA.MODE, self.device_data[serial][DA.MODE]))
+        device = self.device_data[serial]
 
-        # Preserve CONTROLLING_SRC if not in update
-        if device_data.get(DA.CONTROLLING_SRC) is None and self.device_data[serial].get(DA.CONTROLLING_SRC) is not None:
-            preserved_keys.append((DA.CONTROLLING_SRC, self.device_data[serial][DA.CONTROLLING_SRC]))
-
-        # Preserve CONTROLLING_SENSOR if not in update
-        if device_data.get(
-                DA.CONTROLLING_SENSOR) is None and self.device_data[serial].get(
-                DA.CONTROLLING_SENSOR) is not None:
-            preserved_keys.append((DA.CONTROLLING_SENSOR, self.device_data[serial][DA.CONTROLLING_SENSOR]))
-
-        # Update device data
-        self.device_data[serial].update(device_data)
+        # Preserve existing values if not provided in update
+        for key in PRESERVED_STATE_KEYS:
+            if device_data.get(key) is None and device.get(key) is not None:
+                device_data.pop(key, None)
 
-        # Restore preserved values
-        for key, value in preserved_keys:
-            self.device_data[serial][key] = value
+        # Update device data in place
+        device.update(device_data)
 
     def _process_base_info_update(
             self, serial: str, device_data: Dict[str, Any]) -> None:
         """Process base_info update for a device."""
-        self.devices_with_base_info[serial] = device_data["base_info"]
-        # Update with all data from device_data, including sensor_readings and current_temperature
-        self.device_data[serial].update(device_data)
+        base_info = device_data.get("base_info") or {}
+
+        # Copy only the registration keys that are present; state keys go through _process_state_update
+        device = self.device_data[serial]
+        for key in BASE_INFO_KEYS:
+            value = device_data.get(key)
+            if value is not None:
+                device[key] = value
 
         # Fetch sensor metadata and WiFi state to populate all sensor information
-        base_info = device_data.get("base_info", {})
         device_id = base_info.get("id")
         if device_id:
-            asyncio.create_task(self._fetch_sensor_metadata(serial, device_id))
-            asyncio.create_task(self._fetch_wifi_state(serial, device_id))
+            self.hass.async_create_task(self._fetch_device_metadata(serial, device_id))
+
+    async def _fetch_device_metadata(self, serial: str, device_id: int) -> None:
+        """Fetch sensor metadata and WiFi state for a device together, then notify once."""
+        async with self._metadata_semaphore:
+            # Each fetch handles and logs its own errors
+            await asyncio.gather(
+                self._fetch_sensor_metadata(serial, device_id),
+                self._fetch_wifi_state(serial, device_id),
+            )
+        # Either fetch may have swapped in a new device dict; one dispatch covers both
+        if serial in self.device_data:
+            self._schedule_dispatch(serial)
 
     async def _fetch_sensor_metadata(self, serial: str, device_id: int) -> None:
         """Fetch sensor metadata from API for a device."""
@@ -376,11 +523,10 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
 
             async with self.session.get(
                 url,
-                headers={"Authorization": f"Bearer {self.auth_token}"},
             ) as resp:
                 _LOGGER.debug("[%s] Sensor metadata API response status: %s", serial, resp.status)
                 resp.raise_for_status()
-                sensors_data = await resp.json()
+                sensors_data = await resp.json(loads=orjson.loads)
                 _LOGGER.debug("[%s] Sensor metadata API response data: %s", serial, sensors_data)
 
                 # Check if device exists in device_data
@@ -396,37 +542,36 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 _LOGGER.debug("[%s] Sensor metadata stored: %d sensors found", serial, len(sensors_data))
 
                 # Update sensor_readings with names from metadata if they exist
-                if DA.SENSOR_READINGS in updated_device_data:
+                sensor_readings = updated_device_data.get(DA.SENSOR_READINGS)
+                if sensor_readings:
                     for sensor_meta in sensors_data:
-                        # Build sensor key to match sensor_readings structure
-                        src = sensor_meta.get("src", "").upper()
+                        # Build sensor key to match sensor_readings structure; the API may send nulls
+                        src = (sensor_meta.get("src") or "").upper()
                         sensor_id = sensor_meta.get("id")
-                        sensor_type = sensor_meta.get("type", "").upper()
 
                         # For ONBOARD sensors, use src_type as key
                         if src == "ONBOARD":
-                            sensor_key = f"{src}_{sensor_type}"
+                            sensor_key = f"{src}_{(sensor_meta.get('type') or '').upper()}"
                         elif sensor_id is not None:
                             sensor_key = f"{src}_{sensor_id}"
                         else:
-                            sensor_num = sensor_meta.get("sensor", 1)
-                            sensor_key = f"{src}_{sensor_num}"
+                            sensor_key = f"{src}_{sensor_meta.get('sensor', 1)}"
 
                         # Update the name if this sensor exists in sensor_readings
-                        if sensor_key in updated_device_data[DA.SENSOR_READINGS]:
-                            name = sensor_meta.get("name", "").strip()
-                            if name:
-                                old_name = updated_device_data[DA.SENSOR_READINGS][sensor_key].get("name", "").strip()
-                                if old_name != name:
-                                    updated_device_data[DA.SENSOR_READINGS][sensor_key]["name"] = name
-                                    _LOGGER.debug("[%s] Updated sensor %s name from '%s' to '%s'",
-                                                  serial, sensor_key, old_name, name)
-
-                # Update the device_data with the new dict
+                        reading = sensor_readings.get(sensor_key)
+                        if reading is None:
+                            continue
+                        name = (sensor_meta.get("name") or "").strip()
+                        if not name:
+                            continue
+                        old_name = (reading.get("name") or "").strip()
+                        if old_name != name:
+                            reading["name"] = name
+                            _LOGGER.debug("[%s] Updated sensor %s name from '%s' to '%s'",
+                                          serial, sensor_key, old_name, name)
+
+                # Update the device_data with the new dict; _fetch_device_metadata notifies HA
                 self.device_data[serial] = updated_device_data
-
-                # Notify HA of the update
-                self.async_set_updated_data({**self.device_data})
                 _LOGGER.debug("[%s] Sensor metadata update completed successfully", serial)
 
         except ClientResponseError as error:
@@ -449,11 +594,10 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
 
             async with self.session.get(
                 url,
-                headers={"Authorization": f"Bearer {self.auth_token}"},
             ) as resp:
                 _LOGGER.debug("[%s] WiFi state API response status: %s", serial, resp.status)
                 resp.raise_for_status()
-                wifi_data = await resp.json()
+                wifi_data = await resp.json(loads=orjson.loads)
                 _LOGGER.debug("[%s] WiFi state API response data: %s", serial, wifi_data)
 
                 # Check if device exists in device_data
@@ -494,13 +638,10 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                         updated_device_data[DA.RSSI_LEVEL] = system_data["rssi_level"]
                         changed = True
 
-                # Update the device_data with the new dict
-                self.device_data[serial] = updated_device_data
-
-                # Notify HA of the update with a new top-level dict only if changed
+                # Swap in the new dict only if changed; _fetch_device_metadata then notifies
+                # HA, so entities caching the device dict are always told when it is replaced
                 if changed:
-                    _LOGGER.debug("[%s] Notifying Home Assistant of WiFi data update", serial)
-                    self.async_set_updated_data({**self.device_data})
+                    self.device_data[serial] = updated_device_data
                 _LOGGER.debug("[%s] WiFi state update completed successfully", serial)
 
         except ClientResponseError as error:
@@ -519,9 +660,7 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                 _LOGGER.error("[%s] Cannot synthesize base_info: device not found in devices dict", serial)
                 return
 
-            if serial not in self.device_data:
-                self._initialize_device_data(serial)
-
+            was_ready = self._has_base_info(serial)
             device_info = self.devices[serial]
 
             # Create a minimal base_info structure from devices dictionary
@@ -580,7 +719,10 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             self._process_base_info_update(serial, device_update)
 
             # Notify HA of the update
-            self.async_set_updated_data(self.device_data)
+            self._schedule_dispatch(serial)
+
+            if not was_ready:
+                self._async_signal_device_ready(serial)
 
         except Exception as error:
             _LOGGER.error(
@@ -593,11 +735,23 @@ class ComputhermDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     async def async_stop(self) -> None:
         """Stop the coordinator."""
         _LOGGER.info("Stopping coordinator...")
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+            self._dispatch_handle = None
+
         if self._ws_client:
             await self._ws_client.stop()
             self._ws_client = None
 
         self.devices = {}
         self.device_data = {}
-        self.auth_token = None
+        self._clear_auth()
         _LOGGER.info("Coordinator stopped")
+
+    async def async_close_session(self) -> None:
+        """Close the coordinator's HTTP session."""
+        if not self.session.closed:
+            await self.session.close()
+
+
+ComputhermConfigEntry = ConfigEntry[ComputhermDataUpdateCoordinator]
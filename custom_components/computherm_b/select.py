@@ -1,38 +1,40 @@
 """Select platform for Computherm integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Final
+from typing import Any, Final, Mapping
 
-import aiohttp
+import orjson
+from aiohttp import ClientError
 from homeassistant.components.select import SelectEntity
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (API_BASE_URL, API_DEVICE_CONTROL_ENDPOINT,
-                    AVAILABLE_FUNCTIONS, AVAILABLE_MODES, COORDINATOR, DOMAIN)
+from .const import (AVAILABLE_FUNCTIONS, AVAILABLE_MODES, DOMAIN, EMPTY_DATA,
+                    JSON_HEADERS, SIGNAL_DEVICE_READY)
 from .const import DeviceAttributes as DA
-from .coordinator import ComputhermDataUpdateCoordinator
+from .coordinator import (ComputhermConfigEntry,
+                          ComputhermDataUpdateCoordinator, build_control_url,
+                          build_device_info, has_on_off_relay)
 
 _LOGGER = logging.getLogger(__package__)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: ComputhermConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Computherm mode select."""
-    coordinator: ComputhermDataUpdateCoordinator = hass.data[
-        DOMAIN][config_entry.entry_id][COORDINATOR]
+    coordinator = config_entry.runtime_data
 
     _LOGGER.info("Setting up Computherm select platform")
 
-    # Wait for devices to be fetched
-    await coordinator.async_config_entry_first_refresh()
+    # The first refresh has already been awaited in __init__.async_setup_entry
 
     existing_mode_entities = set()
     existing_function_entities = set()
@@ -40,7 +42,7 @@ async def async_setup_entry(
     @callback
     def _async_add_entities_for_device(device_id: str) -> None:
         """Create and add entities for a device that has received base_info."""
-        if not _is_device_ready(coordinator, device_id):
+        if not coordinator.is_device_ready(device_id):
             return
 
         entities_to_add = []
@@ -56,7 +58,7 @@ async def async_setup_entry(
 
         # Add function select if not already added and device is not ON-OFF type
         if device_id not in existing_function_entities:
-            if _has_on_off_relay(coordinator, device_id):
+            if has_on_off_relay(coordinator.device_data.get(device_id, {})):
                 _LOGGER.info(
                     "[%s] Skipping function select entity creation for ON-OFF device",
                     device_id)
@@ -73,57 +75,19 @@ async def async_setup_entry(
             async_add_entities(entities_to_add, True)
             _LOGGER.info("[%s] Select entities created", device_id)
 
-    # Add entities for devices that already have base_info
+    # Add entities for devices that already have base_info; the helper skips the rest
     for serial in coordinator.devices:
-        if _is_device_ready(coordinator, serial):
-            _LOGGER.info("[%s] Found existing base_info", serial)
-            _async_add_entities_for_device(serial)
+        _async_add_entities_for_device(serial)
 
-    # Register listener for coordinator updates
+    # Add entities for devices that receive base_info later
     config_entry.async_on_unload(
-        coordinator.async_add_listener(
-            lambda: async_handle_coordinator_update(
-                coordinator,
-                _async_add_entities_for_device)))
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_DEVICE_READY.format(entry_id=config_entry.entry_id),
+            _async_add_entities_for_device))
     _LOGGER.info("Select platform setup completed")
 
 
-def _is_device_ready(
-        coordinator: ComputhermDataUpdateCoordinator,
-        device_id: str) -> bool:
-    """Check if device is ready for entity creation."""
-    if device_id not in coordinator.devices_with_base_info:
-        _LOGGER.debug("[%s] Device has no base_info yet", device_id)
-        return False
-
-    if not coordinator.devices_with_base_info[device_id]:
-        _LOGGER.debug("[%s] Device has empty base_info", device_id)
-        return False
-
-    return True
-
-
-def _has_on_off_relay(
-        coordinator: ComputhermDataUpdateCoordinator,
-        device_id: str) -> bool:
-    """Check if device has an ON-OFF relay."""
-    device_data = coordinator.device_data.get(device_id, {})
-    relays = device_data.get("relays", {})
-    return any(relay.get("type") == "ON-OFF" for relay in relays.values())
-
-
-@callback
-def async_handle_coordinator_update(
-    coordinator: ComputhermDataUpdateCoordinator,
-    add_entities_callback: callable,
-) -> None:
-    """Handle updated data from the coordinator."""
-    for device_id in coordinator.devices:
-        if device_id in coordinator.devices_with_base_info and coordinator.devices_with_base_info[
-                device_id]:
-            add_entities_callback(device_id)
-
-
 class ComputhermSelectBase(CoordinatorEntity, SelectEntity):
     """Base class for Computherm select entities."""
 
@@ -137,6 +101,7 @@ class ComputhermSelectBase(CoordinatorEntity, SelectEntity):
         """Initialize the select entity."""
         super().__init__(coordinator)
         self.serial_number = serial
+        self._refresh_device_data()
         self._setup_device()
 
     def _setup_device(self) -> None:
@@ -147,25 +112,31 @@ class ComputhermSelectBase(CoordinatorEntity, SelectEntity):
         if not self.api_device_id:
             raise HomeAssistantError(
                 f"No API device ID found for serial number {self.serial_number}")
+        self._control_url = build_control_url(self.api_device_id)
 
         self._setup_device_info()
 
     def _setup_device_info(self) -> None:
         """Set up device info dictionary."""
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, self.serial_number)},
-            "serial_number": self.serial_number,
-            "name": f"Computherm {self.serial_number}",
-            "manufacturer": "Computherm",
-            "model": self.coordinator.devices[self.serial_number].get(DA.DEVICE_TYPE, "") or "B Series Thermostat",
-            "sw_version": self.coordinator.devices[self.serial_number].get(DA.FW_VERSION),
-            "hw_version": self.coordinator.devices[self.serial_number].get("type"),
-        }
+        self._attr_device_info = build_device_info(
+            self.serial_number, self.coordinator.devices[self.serial_number])
+
+    def _refresh_device_data(self) -> None:
+        """Cache this device's data dict; it is only replaced between coordinator updates."""
+        self._device_data = self.coordinator.device_data.get(self.serial_number, EMPTY_DATA)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, skipping updates for other devices."""
+        if self.serial_number not in self.coordinator.last_updated_serials:
+            return
+        self._refresh_device_data()
+        super()._handle_coordinator_update()
 
     @property
-    def device_data(self) -> dict[str, Any]:
+    def device_data(self) -> Mapping[str, Any]:
         """Get the current device data."""
-        return self.coordinator.device_data.get(self.serial_number, {})
+        return self._device_data
 
     @property
     def available(self) -> bool:
@@ -178,26 +149,26 @@ class ComputhermSelectBase(CoordinatorEntity, SelectEntity):
             raise HomeAssistantError(
                 f"Cannot send command: No API device ID available for serial number {self.serial_number}")
 
-        url = f"{API_BASE_URL}{API_DEVICE_CONTROL_ENDPOINT.format(device_id=self.api_device_id)}"
-        headers = {"Authorization": f"Bearer {self.coordinator.auth_token}"}
-
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=command_data, headers=headers) as response:
+            async with self.coordinator.session.post(
+                self._control_url,
+                data=orjson.dumps(command_data),
+                headers=JSON_HEADERS,
+            ) as response:
+                if 200 <= response.status < 300:
+                    _LOGGER.info(
+                        "[%s] Successfully sent command %s",
+                        self.serial_number,
+                        command_data
+                    )
+                    self.coordinator.apply_control_command(self.serial_number, command_data)
+                else:
+                    # Only read the body when it is needed for the error message
                     response_text = await response.text()
-
-                    if 200 <= response.status < 300:
-                        _LOGGER.info(
-                            "[%s] Successfully sent command %s",
-                            self.serial_number,
-                            command_data
-                        )
-                        await self.coordinator.async_request_refresh()
-                    else:
-                        raise HomeAssistantError(
-                            f"Failed to send command. Status: {response.status}, Response: {response_text}"
-                        )
-        except Exception as error:
+                    raise HomeAssistantError(
+                        f"Failed to send command. Status: {response.status}, Response: {response_text}"
+                    )
+        except (ClientError, asyncio.TimeoutError) as error:
             raise HomeAssistantError(
                 f"Error sending command: {error}") from error
 
@@ -2,39 +2,37 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Mapping
 
 from homeassistant.components.binary_sensor import (BinarySensorDeviceClass,
                                                     BinarySensorEntity)
 from homeassistant.components.sensor import (SensorDeviceClass, SensorEntity,
                                              SensorStateClass)
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import COORDINATOR, DOMAIN
+from .const import DOMAIN, EMPTY_DATA
 from .const import DeviceAttributes as DA
-from .coordinator import ComputhermDataUpdateCoordinator
+from .coordinator import (ComputhermConfigEntry,
+                          ComputhermDataUpdateCoordinator, build_device_info)
 
 _LOGGER = logging.getLogger(__package__)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: ComputhermConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Computherm temperature sensors."""
-    coordinator: ComputhermDataUpdateCoordinator = hass.data[
-        DOMAIN][config_entry.entry_id][COORDINATOR]
+    coordinator = config_entry.runtime_data
 
     _LOGGER.info("Setting up Computherm sensor platform")
 
-    # Wait for devices to be fetched
-    await coordinator.async_config_entry_first_refresh()
+    # The first refresh has already been awaited in __init__.async_setup_entry
 
     # Track entities we've already added
     existing_entities = {
@@ -55,13 +53,11 @@ async def async_setup_entry(
     @callback
     def _async_add_entities_for_device(device_id: str) -> None:
         """Create and add entities for a device that has received base_info."""
-        if not _is_device_ready(coordinator, device_id):
+        if not coordinator.is_device_ready(device_id):
             return
 
-        device_data = coordinator.device_data.get(device_id, {})
-        if not device_data:
-            _LOGGER.debug("[%s] Device has no data yet", device_id)
-            return
+        # A ready device always has its data skeleton
+        device_data = coordinator.device_data[device_id]
 
         entities_to_add = []
 
@@ -86,36 +82,22 @@ async def async_setup_entry(
             async_add_entities(entities_to_add, True)
             _LOGGER.info("[%s] Sensor entities created", device_id)
 
-    # Add entities for devices that already have base_info
+    # Add entities for devices that already have base_info; the helper skips the rest
     for serial in coordinator.devices:
-        if _is_device_ready(coordinator, serial):
-            _LOGGER.info("[%s] Found existing base_info", serial)
-            _async_add_entities_for_device(serial)
+        _async_add_entities_for_device(serial)
+
+    @callback
+    def async_handle_coordinator_update() -> None:
+        """Add sensors whose data appeared in the devices named by this listener update."""
+        for device_id in coordinator.last_updated_serials:
+            _async_add_entities_for_device(device_id)
 
     # Register listener for coordinator updates
     config_entry.async_on_unload(
-        coordinator.async_add_listener(
-            lambda: async_handle_coordinator_update(
-                coordinator,
-                _async_add_entities_for_device)))
+        coordinator.async_add_listener(async_handle_coordinator_update))
     _LOGGER.info("Sensor platform setup completed")
 
 
-def _is_device_ready(
-        coordinator: ComputhermDataUpdateCoordinator,
-        device_id: str) -> bool:
-    """Check if device is ready for entity creation."""
-    if device_id not in coordinator.devices_with_base_info:
-        _LOGGER.debug("[%s] Device has no base_info yet", device_id)
-        return False
-
-    if not coordinator.devices_with_base_info[device_id]:
-        _LOGGER.debug("[%s] Device has empty base_info", device_id)
-        return False
-
-    return True
-
-
 def _add_core_sensors(
     coordinator: ComputhermDataUpdateCoordinator,
     device_id: str,
@@ -286,18 +268,6 @@ def _add_diagnostic_sensors(
             existing_entities["uptime"].add(device_id)
 
 
-@callback
-def async_handle_coordinator_update(
-    coordinator: ComputhermDataUpdateCoordinator,
-    add_entities_callback: callable,
-) -> None:
-    """Handle updated data from the coordinator."""
-    for device_id in coordinator.devices:
-        if device_id in coordinator.devices_with_base_info and coordinator.devices_with_base_info[
-                device_id]:
-            add_entities_callback(device_id)
-
-
 class ComputhermSensorBase(CoordinatorEntity):
     """Base class for Computherm sensors."""
 
@@ -311,6 +281,7 @@ class ComputhermSensorBase(CoordinatorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.device_id = serial
+        self._refresh_device_data()
         self._setup_device()
 
     def _setup_device(self) -> None:
@@ -320,19 +291,12 @@ class ComputhermSensorBase(CoordinatorEntity):
 
     def _setup_device_info(self) -> None:
         """Set up device info dictionary."""
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, self.device_id)},
-            "serial_number": self.device_id,
-            "name": f"Computherm {self.device_id}",
-            "manufacturer": "Computherm",
-            "model": self.coordinator.devices[self.device_id].get(DA.DEVICE_TYPE, "") or "B Series Thermostat",
-            "sw_version": self.coordinator.devices[self.device_id].get(DA.FW_VERSION),
-            "hw_version": self.coordinator.devices[self.device_id].get("type"),
-        }
+        self._attr_device_info = build_device_info(
+            self.device_id, self.coordinator.devices[self.device_id])
 
     def _setup_entity_info(self) -> None:
         """Set up entity information."""
-        device_data = self.coordinator.device_data.get(self.device_id, {})
+        device_data = self.device_data
         if not device_data or 'available_sensor_ids' not in device_data:
             _LOGGER.error(
                 "Device %s has no sensor data available",
@@ -374,10 +338,27 @@ class ComputhermSensorBase(CoordinatorEntity):
         """Process the entity name."""
         return base_name
 
+    def _refresh_device_data(self) -> None:
+        """Cache this device's data dict; it is only replaced between coordinator updates."""
+        self._device_data = self.coordinator.device_data.get(self.device_id, EMPTY_DATA)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, skipping updates for other devices."""
+        if self.device_id not in self.coordinator.last_updated_serials:
+            return
+        self._refresh_device_data()
+        if self._should_write_state():
+            super()._handle_coordinator_update()
+
+    def _should_write_state(self) -> bool:
+        """Return whether the refreshed device data needs a state write."""
+        return True
+
     @property
-    def device_data(self) -> dict[str, Any]:
+    def device_data(self) -> Mapping[str, Any]:
         """Get the current device data."""
-        return self.coordinator.device_data.get(self.device_id, {})
+        return self._device_data
 
     @property
     def available(self) -> bool:
@@ -411,7 +392,7 @@ class ComputhermTemperatureSensor(ComputhermNumericSensorBase):
 
     def _setup_entity_info(self) -> None:
         """Set up entity information for temperature sensor."""
-        device_data = self.coordinator.device_data.get(self.device_id, {})
+        device_data = self.device_data
 
         # Multi-sensor case
         if self.sensor_key and DA.SENSOR_READINGS in device_data:
@@ -472,24 +453,19 @@ class ComputhermTemperatureSensor(ComputhermNumericSensorBase):
         """Return the current temperature."""
         # Multi-sensor case
         if self.sensor_key:
-            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, {})
+            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, EMPTY_DATA)
             if self.sensor_key in sensor_readings:
-                reading = sensor_readings[self.sensor_key].get("reading")
-                if reading is not None:
-                    return float(reading)
-                return None
+                return sensor_readings[self.sensor_key].get("reading")
 
         # Fallback to old behavior for backward compatibility
-        if self.device_data.get(DA.TEMPERATURE) is not None:
-            return float(self.device_data[DA.TEMPERATURE])
-        return None
+        return self.device_data.get(DA.TEMPERATURE)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         # Multi-sensor case - check if the specific sensor has a reading
         if self.sensor_key:
-            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, {})
+            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, EMPTY_DATA)
             if self.sensor_key in sensor_readings:
                 # Sensor is available if device is online and it has data
                 return self.device_data.get(DA.ONLINE,
@@ -504,7 +480,7 @@ class ComputhermTemperatureSensor(ComputhermNumericSensorBase):
         if not self.sensor_key:
             return None
 
-        sensor_readings = self.device_data.get(DA.SENSOR_READINGS, {})
+        sensor_readings = self.device_data.get(DA.SENSOR_READINGS, EMPTY_DATA)
         if self.sensor_key not in sensor_readings:
             return None
 
@@ -533,7 +509,7 @@ class ComputhermHumiditySensor(ComputhermNumericSensorBase):
 
     def _setup_entity_info(self) -> None:
         """Set up entity information."""
-        device_data = self.coordinator.device_data.get(self.device_id, {})
+        device_data = self.device_data
 
         # Try to find humidity sensor name - prioritize metadata over sensor_readings
         sensor_name = ""
@@ -591,9 +567,7 @@ class ComputhermHumiditySensor(ComputhermNumericSensorBase):
     @property
     def native_value(self) -> float | None:
         """Return the current humidity."""
-        if self.device_data.get(DA.HUMIDITY) is not None:
-            return float(self.device_data[DA.HUMIDITY])
-        return None
+        return self.device_data.get(DA.HUMIDITY)
 
 
 class ComputhermDiagnosticSensorBase(ComputhermNumericSensorBase):
@@ -645,7 +619,7 @@ class ComputhermBatterySensor(ComputhermDiagnosticSensorBase):
         """Return the battery level."""
         # Sensor-specific case
         if self.sensor_key:
-            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, {})
+            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, EMPTY_DATA)
             if self.sensor_key in sensor_readings:
                 battery = sensor_readings[self.sensor_key].get("battery")
                 if battery is not None:
@@ -669,7 +643,7 @@ class ComputhermBatterySensor(ComputhermDiagnosticSensorBase):
         """Return if entity is available."""
         # Sensor-specific case - check if the specific sensor has battery data
         if self.sensor_key:
-            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, {})
+            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, EMPTY_DATA)
             if self.sensor_key in sensor_readings:
                 return self.device_data.get(DA.ONLINE, False) and "battery" in sensor_readings[self.sensor_key]
 
@@ -722,7 +696,7 @@ class ComputhermRSSISensor(ComputhermDiagnosticSensorBase):
         """Return the RSSI value."""
         # Sensor-specific case
         if self.sensor_key:
-            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, {})
+            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, EMPTY_DATA)
             if self.sensor_key in sensor_readings:
                 rssi = sensor_readings[self.sensor_key].get("rssi")
                 if rssi is not None:
@@ -746,7 +720,7 @@ class ComputhermRSSISensor(ComputhermDiagnosticSensorBase):
         """Return if entity is available."""
         # Sensor-specific case - check if the specific sensor has RSSI data
         if self.sensor_key:
-            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, {})
+            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, EMPTY_DATA)
             if self.sensor_key in sensor_readings:
                 return self.device_data.get(DA.ONLINE, False) and "rssi" in sensor_readings[self.sensor_key]
 
@@ -798,7 +772,7 @@ class ComputhermRSSILevelSensor(ComputhermSensorBase, SensorEntity):
         """Return the RSSI level."""
         # Sensor-specific case
         if self.sensor_key:
-            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, {})
+            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, EMPTY_DATA)
             if self.sensor_key in sensor_readings:
                 return sensor_readings[self.sensor_key].get("rssi_level")
             return None
@@ -811,7 +785,7 @@ class ComputhermRSSILevelSensor(ComputhermSensorBase, SensorEntity):
         """Return if entity is available."""
         # Sensor-specific case - check if the specific sensor has RSSI level data
         if self.sensor_key:
-            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, {})
+            sensor_readings = self.device_data.get(DA.SENSOR_READINGS, EMPTY_DATA)
             if self.sensor_key in sensor_readings:
                 return self.device_data.get(DA.ONLINE, False) and "rssi_level" in sensor_readings[self.sensor_key]
 
@@ -850,7 +824,7 @@ class ComputhermSSIDSensor(ComputhermSensorBase, SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the SSID value."""
-        wifi_info = self.device_data.get("wifi_info", {})
+        wifi_info = self.device_data.get("wifi_info", EMPTY_DATA)
         return wifi_info.get("ssid")
 
 
@@ -868,7 +842,7 @@ class ComputhermBSSIDSensor(ComputhermSensorBase, SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the BSSID value."""
-        wifi_info = self.device_data.get("wifi_info", {})
+        wifi_info = self.device_data.get("wifi_info", EMPTY_DATA)
         return wifi_info.get("bssid")
 
 
@@ -886,7 +860,7 @@ class ComputhermIPSensor(ComputhermSensorBase, SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the IP address value."""
-        wifi_info = self.device_data.get("wifi_info", {})
+        wifi_info = self.device_data.get("wifi_info", EMPTY_DATA)
         return wifi_info.get("ip4")
 
 
@@ -904,7 +878,7 @@ class ComputhermDHCPSensor(ComputhermSensorBase, SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the DHCP hostname value."""
-        wifi_info = self.device_data.get("wifi_info", {})
+        wifi_info = self.device_data.get("wifi_info", EMPTY_DATA)
         return wifi_info.get("dhcp_hostname")
 
 
@@ -953,24 +927,23 @@ class ComputhermUptimeSensor(ComputhermSensorBase, SensorEntity):
         """Set up entity information."""
         self._attr_unique_id = f"{DOMAIN}_{self.device_id}_uptime"
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        # Only update if boot_timestamp has changed
-        system_data = self.device_data.get("system", {})
+    def _should_write_state(self) -> bool:
+        """Only write state when boot_timestamp has changed."""
+        system_data = self.device_data.get("system", EMPTY_DATA)
         current_boot_timestamp = system_data.get("boot_timestamp")
 
-        if current_boot_timestamp != self._last_boot_timestamp:
-            _LOGGER.debug("[%s] Device has updated uptime data: %s", self.device_id, system_data.get("uptime"))
-            self._last_boot_timestamp = current_boot_timestamp
-            super()._handle_coordinator_update()
+        if current_boot_timestamp == self._last_boot_timestamp:
+            return False
+        _LOGGER.debug("[%s] Device has updated uptime data: %s", self.device_id, system_data.get("uptime"))
+        self._last_boot_timestamp = current_boot_timestamp
+        return True
 
     @property
     def native_value(self) -> Any | None:
         """Return the boot/start timestamp."""
         from datetime import datetime
 
-        system_data = self.device_data.get("system", {})
+        system_data = self.device_data.get("system", EMPTY_DATA)
 
         # Use pre-calculated boot timestamp from websocket
         boot_timestamp = system_data.get("boot_timestamp")
@@ -987,7 +960,7 @@ class ComputhermUptimeSensor(ComputhermSensorBase, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes with uptime breakdown."""
-        system_data = self.device_data.get("system", {})
+        system_data = self.device_data.get("system", EMPTY_DATA)
         uptime_data = system_data.get("uptime")
 
         if not uptime_data:
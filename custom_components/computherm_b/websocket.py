@@ -6,47 +6,131 @@ import base64
 import json
 import logging
 import random
-import re
-import ssl
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, Final, List, Optional
+from typing import Any, Callable, Dict, Final, List, Optional, Union
 
-import websockets
-from websockets.exceptions import ConnectionClosed
+import aiohttp
+import orjson
 
 from .const import DeviceAttributes as DA
 from .const import WebSocketConfig as WSC
 
 _LOGGER = logging.getLogger(__package__)
 
-# Create SSL context at module level, outside of any async context
-SSL_CONTEXT: Final = ssl.create_default_context()
-SSL_CONTEXT.load_default_certs()
+# Socket.IO event frames on the devices namespace
+DEVICES_EVENT_PREFIX: Final = "42/devices,"
+DEVICES_EVENT_PREFIX_BYTES: Final = DEVICES_EVENT_PREFIX.encode()
+DEVICES_EVENT_PREFIX_LEN: Final = len(DEVICES_EVENT_PREFIX)
+
+# Optional per-sensor attributes copied from each reading
+SENSOR_ATTRIBUTES: Final = ("battery", "rssi", "rssi_level")
+
+# Relay state that means the relay is energized
+RELAY_STATE_ON: Final = WSC.Events.RELAY_STATES["ON"]
+
+# Close frames that mean the connection ended without an error
+NORMAL_CLOSE_CODES: Final = (1000, 1005)
+
+
+class WebSocketClosed(Exception):
+    """Raised when the server closes the WebSocket connection."""
+
+    def __init__(self, code: Optional[int]) -> None:
+        """Initialize with the close code sent by the server."""
+        super().__init__(f"WebSocket closed with code {code}")
+        self.code = code
+
+
+def _parse_reading(value: Any) -> Optional[float]:
+    """Convert a numeric reading to float, mapping placeholders like "N/A" or "OFF" to None."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _apply_temperature_reading(
+        device_update: Dict[str, Any],
+        sensor_entry: Dict[str, Any],
+        sensor_key: str,
+        reading: Dict[str, Any],
+        serial: str
+) -> None:
+    """Store a temperature reading on its sensor entry."""
+    reading_value = _parse_reading(reading["reading"])
+    sensor_entry["reading"] = reading_value
+
+    # Log each temperature sensor update with sensor name and value; this runs per reading
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "[%s] Sensor %s (%s) temperature updated: %s°C",
+            serial,
+            sensor_key,
+            reading.get("name", sensor_key),
+            reading_value
+        )
+
+    # For backward compatibility, keep the first temperature reading in DA.TEMPERATURE
+    if DA.TEMPERATURE not in device_update:
+        device_update[DA.TEMPERATURE] = reading_value
+
+
+def _apply_humidity_reading(
+        device_update: Dict[str, Any],
+        sensor_entry: Dict[str, Any],
+        sensor_key: str,
+        reading: Dict[str, Any],
+        serial: str
+) -> None:
+    """Store a humidity reading at device level."""
+    device_update[DA.HUMIDITY] = _parse_reading(reading["reading"])
+
+
+def _apply_target_temperature_reading(
+        device_update: Dict[str, Any],
+        sensor_entry: Dict[str, Any],
+        sensor_key: str,
+        reading: Dict[str, Any],
+        serial: str
+) -> None:
+    """Store a target temperature reading at device level."""
+    device_update[DA.TARGET_TEMPERATURE] = _parse_reading(reading["reading"])
+
+
+# Reading type -> handler, so each reading costs a single lookup
+_READING_HANDLERS: Final[Dict[str, Callable[..., None]]] = {
+    WSC.Events.TEMPERATURE: _apply_temperature_reading,
+    WSC.Events.HUMIDITY: _apply_humidity_reading,
+    WSC.Events.TARGET_TEMPERATURE: _apply_target_temperature_reading,
+}
 
 
 class WebSocketMessageHandler:
     """Handle WebSocket message parsing and processing."""
 
     @staticmethod
-    def handle_websocket_message(message: str) -> Optional[tuple[bool, Any]]:
+    def handle_websocket_message(message: Union[str, bytes]) -> Optional[tuple[bool, Any]]:
         """Handle WebSocket message parsing and error checking.
 
+        Binary frames are matched against the prefix as bytes and handed to orjson
+        without being decoded first.
+
         Returns:
             Optional[tuple[bool, Any]]: A tuple containing:
                 - bool: True if message is an error that requires connection closure
                 - Any: Parsed message data if not an error, or error details if is error
             Returns None if message format is invalid or not a devices message
         """
-        if not message.startswith("42/devices"):
-            return None
-
-        match = re.match(r'42/devices,(.+)', message)
-        if not match:
-            _LOGGER.warning("Failed to match message format: %s", message)
+        if isinstance(message, bytes):
+            if not message.startswith(DEVICES_EVENT_PREFIX_BYTES):
+                return None
+        elif not message.startswith(DEVICES_EVENT_PREFIX):
             return None
 
         try:
-            data = json.loads(match.group(1))
+            data = orjson.loads(message[DEVICES_EVENT_PREFIX_LEN:])
             if not isinstance(data, list) or len(data) != 2:
                 _LOGGER.warning("Invalid message structure: %s", data)
                 return None
@@ -98,8 +182,11 @@ class WebSocketMessageHandler:
     ) -> None:
         """Process temperature and humidity readings and update device state."""
         # Initialize sensor_readings if not present
-        if DA.SENSOR_READINGS not in device_update:
-            device_update[DA.SENSOR_READINGS] = {}
+        sensor_readings = device_update.setdefault(DA.SENSOR_READINGS, {})
+        # Bind per-reading lookups as locals once instead of resolving globals each iteration
+        get_handler = _READING_HANDLERS.get
+        sensor_attributes = SENSOR_ATTRIBUTES
+        source_key = DA.SOURCE
 
         for reading in readings:
             if "reading" not in reading:
@@ -119,55 +206,32 @@ class WebSocketMessageHandler:
                 sensor_key = f"{src}_{sensor_num}"
 
             # Initialize sensor entry if not exists
-            if sensor_key not in device_update[DA.SENSOR_READINGS]:
-                device_update[DA.SENSOR_READINGS][sensor_key] = {}
+            sensor_entry = sensor_readings.setdefault(sensor_key, {})
 
             # Store sensor metadata
-            device_update[DA.SENSOR_READINGS][sensor_key].update({
+            sensor_entry.update({
                 "src": src.lower(),
                 "name": reading.get("name", ""),
                 "type": reading.get("type"),
             })
 
             # Add common sensor attributes if present
-            for attr in ["battery", "rssi", "rssi_level"]:
+            for attr in sensor_attributes:
                 if attr in reading:
                     if attr == "rssi_level":
-                        device_update[DA.SENSOR_READINGS][sensor_key][attr] = str(
+                        sensor_entry[attr] = str(
                             reading[attr]).lower() if reading[attr] is not None else None
                     else:
-                        device_update[DA.SENSOR_READINGS][sensor_key][attr] = reading[attr]
+                        sensor_entry[attr] = reading[attr]
 
             # Store source at device level from the first sensor
-            if "src" in reading and DA.SOURCE not in device_update:
-                device_update[DA.SOURCE] = src.lower()
+            if "src" in reading and source_key not in device_update:
+                device_update[source_key] = src.lower()
 
             # Process different reading types
-            if reading["type"] == WSC.Events.TEMPERATURE:
-                reading_value = None if reading["reading"] == "N/A" else reading["reading"]
-                device_update[DA.SENSOR_READINGS][sensor_key]["reading"] = reading_value
-
-                # Log each temperature sensor update with sensor name and value
-                sensor_name = reading.get("name", sensor_key)
-                _LOGGER.debug(
-                    "[%s] Sensor %s (%s) temperature updated: %s°C",
-                    serial,
-                    sensor_key,
-                    sensor_name,
-                    reading_value
-                )
-
-                # For backward compatibility, keep the first temperature reading in DA.TEMPERATURE
-                if DA.TEMPERATURE not in device_update:
-                    device_update[DA.TEMPERATURE] = reading_value
-
-            elif reading["type"] == WSC.Events.HUMIDITY:
-                reading_value = None if reading["reading"] == "N/A" else reading["reading"]
-                device_update[DA.HUMIDITY] = reading_value
-
-            elif reading["type"] == WSC.Events.TARGET_TEMPERATURE:
-                reading_value = None if reading["reading"] == "N/A" else reading["reading"]
-                device_update[DA.TARGET_TEMPERATURE] = reading_value
+            handler = get_handler(reading["type"])
+            if handler:
+                handler(device_update, sensor_entry, sensor_key, reading, serial)
 
         # Update current_temperature from the controlling sensor
         # This ensures climate entity's current_temperature is updated with every reading update
@@ -218,7 +282,7 @@ class WebSocketMessageHandler:
         """Process relay states and update device state."""
         for relay in relays:
             if "relay_state" in relay:
-                relay_state = relay[DA.RELAY_STATE] == WSC.Events.RELAY_STATES["ON"]
+                relay_state = relay[DA.RELAY_STATE] == RELAY_STATE_ON
                 device_update[DA.RELAY_STATE] = relay_state
                 # Keep is_heating for backward compatibility
                 device_update["is_heating"] = relay_state
@@ -229,27 +293,19 @@ class WebSocketMessageHandler:
                 device_update[DA.FUNCTION] = function_value
 
             if "mode" in relay:
-                mode_value = (str(relay["mode"]).lower()
-                              if relay["mode"] is not None else None)
-                device_update[DA.MODE] = mode_value
-
-            # Set target temperature based on mode
-            # If mode is SCHEDULE, use schedule_set_point
-            # If mode is MANUAL, use manual_set_point
-            if "mode" in relay:
-                if relay["mode"] == "SCHEDULE" and "schedule_set_point" in relay:
-                    set_point = (None if relay["schedule_set_point"] in ("N/A", "OFF")
-                                 else relay["schedule_set_point"])
-                    device_update[DA.TARGET_TEMPERATURE] = set_point
-                elif relay["mode"] == "MANUAL" and "manual_set_point" in relay:
-                    set_point = (None if relay["manual_set_point"] in ("N/A", "OFF")
-                                 else relay["manual_set_point"])
-                    device_update[DA.TARGET_TEMPERATURE] = set_point
+                mode = relay["mode"]
+                device_update[DA.MODE] = str(mode).lower() if mode is not None else None
+
+                # Set target temperature based on mode
+                # If mode is SCHEDULE, use schedule_set_point
+                # If mode is MANUAL, use manual_set_point
+                if mode == "SCHEDULE" and "schedule_set_point" in relay:
+                    device_update[DA.TARGET_TEMPERATURE] = _parse_reading(relay["schedule_set_point"])
+                elif mode == "MANUAL" and "manual_set_point" in relay:
+                    device_update[DA.TARGET_TEMPERATURE] = _parse_reading(relay["manual_set_point"])
             # Fallback: if no mode, try manual_set_point (backward compatibility)
             elif "manual_set_point" in relay and DA.TARGET_TEMPERATURE not in device_update:
-                set_point = (None if relay["manual_set_point"] in ("N/A", "OFF")
-                             else relay["manual_set_point"])
-                device_update[DA.TARGET_TEMPERATURE] = set_point
+                device_update[DA.TARGET_TEMPERATURE] = _parse_reading(relay["manual_set_point"])
 
             # Store controlling sensor information for multi-sensor support
             if "controlling_src" in relay:
@@ -260,10 +316,7 @@ class WebSocketMessageHandler:
 
             # For devices with controlling_reading (older format)
             if "controlling_reading" in relay:
-                device_update[DA.CURRENT_TEMPERATURE] = (
-                    None if relay["controlling_reading"] == "N/A"
-                    else relay["controlling_reading"]
-                )
+                device_update[DA.CURRENT_TEMPERATURE] = _parse_reading(relay["controlling_reading"])
 
         # Determine current_temperature from the controlling sensor
         # This is used by the climate entity
@@ -413,17 +466,30 @@ class WebSocketClient:
         device_serials: List[str],
         data_callback: Callable[[Dict[str, Any]], None],
         coordinator=None,
+        session: Optional[aiohttp.ClientSession] = None,
     ) -> None:
         """Initialize the WebSocket client."""
         self.auth_token = auth_token
         self.device_serials = device_serials
         self.data_callback = data_callback
         self.coordinator = coordinator
+        self.session = session
+        # The token and device list are fixed for the client's lifetime, so the
+        # login, subscribe and scan frames are built once
+        self._login_msg: Final[str] = WSC.MESSAGE_TEMPLATES["LOGIN"].format(
+            access_token=auth_token)
+        self._subscribe_msg: Final[str] = WSC.MESSAGE_TEMPLATES["SUBSCRIBE"].format(
+            device_ids=orjson.dumps(device_serials).decode())
+        self._scan_msgs: Final[Dict[str, str]] = {
+            serial: WSC.MESSAGE_TEMPLATES["SCAN"].format(device_id=serial)
+            for serial in device_serials
+        }
         self.token_expiry: Optional[datetime] = self._get_token_expiry(
             auth_token)
         self.websocket = None
         self._ws_task: Optional[asyncio.Task] = None
-        self._watchdog_task: Optional[asyncio.Task] = None
+        # Short-lived helper tasks (base_info timeout monitors), cancelled on stop
+        self._background_tasks: set[asyncio.Task] = set()
         self._sid: Optional[str] = None
         self._ping_interval: Optional[float] = None
         self._last_message_time: Optional[datetime] = None
@@ -461,22 +527,29 @@ class WebSocketClient:
             # Reset the force reconnect event
             self._force_reconnect.clear()
 
-            # Start the watchdog task if it's not running
-            if not self._watchdog_task or self._watchdog_task.done():
-                self._watchdog_task = asyncio.create_task(self._connection_watchdog())
-
             # Start the main websocket task
             if not self._ws_task or self._ws_task.done():
                 self._ws_task = asyncio.create_task(self._websocket_handler())
         finally:
             self._connecting = False
 
+    @property
+    def is_running(self) -> bool:
+        """Return True while the connection task is alive, including during backoff."""
+        return self._ws_task is not None and not self._ws_task.done()
+
     async def stop(self) -> None:
         """Stop the WebSocket connection."""
         if not self._stopping:
             self._stopping = True
             await self._cleanup_tasks()
 
+    def _create_background_task(self, coro) -> None:
+        """Run a helper coroutine in a task that is cancelled when the client stops."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     async def _cleanup_tasks(self) -> None:
         """Clean up WebSocket tasks."""
         # Close websocket first to trigger clean shutdown
@@ -498,55 +571,12 @@ class WebSocketClient:
             finally:
                 self._ws_task = None
 
-        # Cancel and cleanup watchdog task
-        if self._watchdog_task and not self._watchdog_task.done():
-            self._watchdog_task.cancel()
-            try:
-                await self._watchdog_task
-            except asyncio.CancelledError:
-                pass
-            finally:
-                self._watchdog_task = None
-
-    async def _connection_watchdog(self) -> None:
-        """Monitor the connection and force reconnection if it becomes stale."""
-        while not self._stopping:
-            # Check if we have an active connection and ping interval
-            if (self.websocket is not None and
-                self._last_message_time is not None and
-                    self._ping_interval is not None):
-
-                # Calculate time since last message
-                time_since_last_message = (
-                    datetime.now() - self._last_message_time).total_seconds()
-                ping_timeout = self._ping_interval * 1.2  # Add 20% to the ping interval
-
-                # _LOGGER.debug(
-                #     "Watchdog checking connection status... (last message time: %.1f)",
-                #     time_since_last_message)
-
-                # If we've exceeded the timeout, force a reconnection
-                if time_since_last_message > ping_timeout:
-                    _LOGGER.warning(
-                        "Watchdog detected stale connection: %.1f sec since last message " +
-                        "(timeout: %.1f seconds). Forcing reconnection...",
-                        time_since_last_message,
-                        ping_timeout)
-
-                    # Close the websocket to force a reconnection
-                    if self.websocket:
-                        try:
-                            # Use create_task to avoid blocking the watchdog
-                            asyncio.create_task(self.websocket.close())
-                        except Exception as error:
-                            _LOGGER.debug("Error closing stale websocket: %s", error)
-
-            # Check every 5 seconds (or half the ping interval if available)
-            check_interval = 5.0
-            if self._ping_interval is not None:
-                check_interval = min(self._ping_interval / 2, 5.0)
-
-            await asyncio.sleep(check_interval)
+        # Cancel helper tasks, which may be sleeping through a scan timeout or retry backoff
+        tasks = list(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _websocket_handler(self) -> None:
         """Handle WebSocket connection with improved exponential backoff."""
@@ -555,19 +585,14 @@ class WebSocketClient:
                 # Reset namespace disconnect flag before starting a new connection
                 self._namespace_disconnect_received = False
                 await self._handle_connection()
-            except ConnectionClosed as error:
-                # Check if error.rcvd is an object with a code attribute or an integer
-                if hasattr(error, 'rcvd'):
-                    if hasattr(error.rcvd, 'code') and error.rcvd.code in (1000, 1005):
-                        _LOGGER.debug("WebSocket connection closed normally")
-                    else:
-                        _LOGGER.warning("WebSocket connection closed: %s", error)
+            except WebSocketClosed as error:
+                if error.code in NORMAL_CLOSE_CODES:
+                    _LOGGER.debug("WebSocket connection closed normally")
+                elif self._namespace_disconnect_received:
+                    # This is part of normal disconnection after a namespace disconnect
+                    _LOGGER.debug("WebSocket connection closed after namespace disconnect")
                 else:
-                    # This is likely part of normal disconnection after a namespace disconnect
-                    if self._namespace_disconnect_received:
-                        _LOGGER.debug("WebSocket connection closed after namespace disconnect")
-                    else:
-                        _LOGGER.warning("WebSocket connection closed with unexpected format: %s", error)
+                    _LOGGER.warning("WebSocket connection closed: %s", error)
             except Exception as error:
                 # For error code -3 ("Try again"), only set error state after
                 # backoff time
@@ -590,12 +615,12 @@ class WebSocketClient:
 
             self._reconnect_attempts += 1
 
-            # Implement exponential backoff with jitter
-            jitter = random.uniform(0.8, 1.2)
-            backoff_time = min(
-                self._reconnect_interval * (2 ** (self._reconnect_attempts - 1)) * jitter,
+            # Exponential backoff with full jitter, so clients that lost the server
+            # at the same moment don't reconnect in lockstep
+            backoff_time = random.uniform(0, min(
+                self._reconnect_interval * (2 ** min(self._reconnect_attempts - 1, 10)),
                 self._max_reconnect_interval
-            )
+            ))
 
             _LOGGER.debug(
                 "Reconnection attempt %d in %.1f seconds",
@@ -664,38 +689,58 @@ class WebSocketClient:
             self.websocket = None
 
         _LOGGER.debug("Attempting to establish WebSocket connection...")
-        async with websockets.connect(WSC.BASE_URL, ssl=SSL_CONTEXT) as websocket:
+        # The coordinator's dedicated session keeps its TCPConnector (and TLS context) across reconnects
+        # aiohttp's heartbeat closes the socket when WebSocket pings go unanswered
+        async with self.session.ws_connect(WSC.BASE_URL, heartbeat=WSC.HEARTBEAT_INTERVAL) as websocket:
             self.websocket = websocket
-            # Reset connection parameters on successful connection
-            self._reconnect_attempts = 0
-            self._reconnect_interval = 5
             _LOGGER.debug("WebSocket connected successfully")
 
             await self._handle_initial_connection()
             await self._setup_connection()
+            # Only reset the backoff once login and subscribe succeeded, so a server
+            # that accepts the socket but rejects the session still backs off
+            self._reconnect_attempts = 0
             await self._process_messages()
 
+    async def _recv(self, allow_binary: bool = False) -> Union[str, bytes]:
+        """Receive the next data frame, raising WebSocketClosed when the connection ends.
+
+        Binary frames are only returned when allow_binary is set; the handshake
+        steps expect text.
+        """
+        msg = await self.websocket.receive()
+        if msg.type == aiohttp.WSMsgType.TEXT:
+            return msg.data
+        if msg.type == aiohttp.WSMsgType.BINARY and allow_binary:
+            return msg.data
+        if msg.type == aiohttp.WSMsgType.ERROR:
+            raise msg.data
+        if msg.type == aiohttp.WSMsgType.CLOSE:
+            raise WebSocketClosed(msg.data)
+        if msg.type in (aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED):
+            raise WebSocketClosed(self.websocket.close_code)
+        raise ValueError(f"Unexpected WebSocket frame type: {msg.type}")
+
     async def _handle_initial_connection(self) -> None:
         """Handle initial connection message and setup."""
-        message = await self.websocket.recv()
+        message = await self._recv()
         if not message.startswith("0"):
             raise ValueError(f"Unexpected initial message: {message}")
 
-        connect_data = json.loads(message[1:])
+        connect_data = orjson.loads(message[1:])
         self._sid = connect_data.get("sid")
         self._ping_interval = connect_data.get("pingInterval", 25000) / 1000
         # _LOGGER.debug("WebSocket initialized with SID: %s", self._sid)
 
     async def _scan_device_with_retry(self, serial: str, initial_scan: bool = True) -> None:
         """Send scan request for a device with retry logic."""
-        scan_msg = WSC.MESSAGE_TEMPLATES["SCAN"].format(device_id=serial)
         _LOGGER.debug("[%s] Sending scan request", serial)
-        await self.websocket.send(scan_msg)
+        await self.websocket.send_str(self._scan_msgs[serial])
 
         # Only consume the response on initial scan during setup
         # Retry scans will be processed by the main message loop
         if initial_scan:
-            await self.websocket.recv()
+            await self._recv()
             _LOGGER.debug("[%s] Scan response received", serial)
 
         # Initialize retry count for this device
@@ -734,7 +779,7 @@ class WebSocketClient:
                     if self.websocket and not self._stopping:
                         await self._scan_device_with_retry(serial, initial_scan=False)
                         # Schedule another check after timeout
-                        asyncio.create_task(self._monitor_base_info_timeout())
+                        self._create_background_task(self._monitor_base_info_timeout())
                 except Exception as error:
                     _LOGGER.error(
                         "[%s] Error during scan retry: %s",
@@ -757,11 +802,9 @@ class WebSocketClient:
         """Set up the connection with login and subscriptions."""
         try:
             # Send login message
-            login_message = WSC.MESSAGE_TEMPLATES["LOGIN"].format(
-                access_token=self.auth_token)
             _LOGGER.debug("WebSocket: Sending login message")
-            await self.websocket.send(login_message)
-            login_response = await self.websocket.recv()
+            await self.websocket.send_str(self._login_msg)
+            login_response = await self._recv()
             _LOGGER.debug("WebSocket: Login response received")
 
             # Check for authentication errors in the login response
@@ -780,12 +823,9 @@ class WebSocketClient:
 
         try:
             # Subscribe to all devices in a single message
-            device_serials_json = json.dumps(self.device_serials)
-            subscribe_msg = WSC.MESSAGE_TEMPLATES["SUBSCRIBE"].format(
-                device_ids=device_serials_json)
-            _LOGGER.debug("WebSocket: Sending subscribe message for devices: %s", device_serials_json)
-            await self.websocket.send(subscribe_msg)
-            subscribe_response = await self.websocket.recv()
+            _LOGGER.debug("WebSocket: Sending subscribe message for devices: %s", self.device_serials)
+            await self.websocket.send_str(self._subscribe_msg)
+            subscribe_response = await self._recv()
             _LOGGER.debug(
                 "WebSocket: Subscribe response received: %s",
                 subscribe_response)
@@ -808,7 +848,7 @@ class WebSocketClient:
             self._last_message_time = datetime.now()
 
             # Start monitoring for devices that didn't receive base_info
-            asyncio.create_task(self._monitor_base_info_timeout())
+            self._create_background_task(self._monitor_base_info_timeout())
         except Exception as error:
             _LOGGER.error("Error during setup: %s", error)
             if self.websocket:
@@ -848,7 +888,7 @@ class WebSocketClient:
                     recv_timeout = max(self._ping_interval, 5.0)
 
                 # Wait for either a message or the timeout
-                message = await asyncio.wait_for(self.websocket.recv(), timeout=recv_timeout)
+                message = await asyncio.wait_for(self._recv(allow_binary=True), timeout=recv_timeout)
                 await self._handle_message(message)
 
             except asyncio.TimeoutError:
@@ -877,8 +917,8 @@ class WebSocketClient:
                 else:
                     # No last message time or ping interval, continue waiting
                     continue
-            except ConnectionClosed as error:
-                if error.rcvd.code not in (1000, 1005):
+            except WebSocketClosed as error:
+                if error.code not in NORMAL_CLOSE_CODES:
                     _LOGGER.warning("WebSocket connection closed: %s", error)
                 return  # Exit to trigger reconnection
             except Exception as error:
@@ -887,22 +927,23 @@ class WebSocketClient:
                     await self.websocket.close()
                 return  # Exit to trigger reconnection
 
-    async def _handle_message(self, message: str) -> None:
+    async def _handle_message(self, message: Union[str, bytes]) -> None:
         """Handle incoming WebSocket message."""
 
-        time_since_last_message = (
-            datetime.now() -
-            self._last_message_time).total_seconds()
+        # Only used for log messages below; read the clock once per frame
+        now = datetime.now()
+        time_since_last_message = (now - self._last_message_time).total_seconds()
+        self._last_message_time = now  # Update last ping time
 
-        self._last_message_time = datetime.now()  # Update last ping time
-
-        # Handle Socket.IO protocol messages
-        if message == "2":  # Socket.IO v4 ping message from server
+        # Handle Socket.IO protocol messages; binary frames only carry event payloads
+        if isinstance(message, bytes):
+            pass
+        elif message == "2":  # Socket.IO v4 ping message from server
             # _LOGGER.debug(
             #     "After %.1f sec, server ping received, sending pong",
             #     time_since_last_message)
             # Send pong response (3 is pong in Socket.IO v4)
-            await self.websocket.send("3")
+            await self.websocket.send_str("3")
             return
         elif message == "1":  # Socket.IO v4 disconnect message
             _LOGGER.warning(
@@ -946,27 +987,29 @@ class WebSocketClient:
                 await self.websocket.close()
             return
 
-        # Try to extract serial from message for logging
-        serial = None
-        try:
-            if isinstance(data, list) and len(data) >= 2 and isinstance(data[1], dict):
-                # Try to get serial from base_info first
-                if "base_info" in data[1] and isinstance(data[1]["base_info"], dict):
-                    serial = data[1]["base_info"].get(DA.SERIAL_NUMBER)
-                # If not in base_info, try direct serial_number field
-                if not serial:
-                    serial = data[1].get(DA.SERIAL_NUMBER)
-        except (TypeError, KeyError, IndexError):
-            pass  # Silently ignore if we can't extract serial
-
-        if serial:
-            _LOGGER.debug(
-                "[%s] After %.1f sec, received WebSocket message: %s",
-                serial, time_since_last_message, data)
-        else:
-            _LOGGER.debug(
-                "After %.1f sec, received WebSocket message: %s",
-                time_since_last_message, data)
+        # Only dig the serial out of the frame when the debug record will be emitted
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # Try to extract serial from message for logging
+            serial = None
+            try:
+                if isinstance(data, list) and len(data) >= 2 and isinstance(data[1], dict):
+                    # Try to get serial from base_info first
+                    if "base_info" in data[1] and isinstance(data[1]["base_info"], dict):
+                        serial = data[1]["base_info"].get(DA.SERIAL_NUMBER)
+                    # If not in base_info, try direct serial_number field
+                    if not serial:
+                        serial = data[1].get(DA.SERIAL_NUMBER)
+            except (TypeError, KeyError, IndexError):
+                pass  # Silently ignore if we can't extract serial
+
+            if serial:
+                _LOGGER.debug(
+                    "[%s] After %.1f sec, received WebSocket message: %s",
+                    serial, time_since_last_message, data)
+            else:
+                _LOGGER.debug(
+                    "After %.1f sec, received WebSocket message: %s",
+                    time_since_last_message, data)
 
         if data[0] != "event":
             _LOGGER.debug(
@@ -7,7 +7,8 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from custom_components.computherm_b.const import DeviceAttributes as DA
-from custom_components.computherm_b.websocket import WebSocketClient
+from custom_components.computherm_b.websocket import (WebSocketClient,
+                                                      WebSocketMessageHandler)
 
 
 @pytest.mark.asyncio
@@ -68,3 +69,30 @@ async def test_handle_message_event_2():
 
     # Call the method under test
     await client._handle_message(message)
+
+
+def test_process_base_info_parses_readings_as_float():
+    """Test that readings and set points are stored as floats, placeholders as None."""
+    with open("tests/fixtures/message_1111111111.json", "r", encoding='utf8') as f:
+        event_data = json.load(f)[1]
+
+    device_update = WebSocketMessageHandler.process_base_info(event_data, "1111111111")
+
+    # manual_set_point arrives as the integer 21
+    assert device_update[DA.TARGET_TEMPERATURE] == 21.0
+    assert isinstance(device_update[DA.TARGET_TEMPERATURE], float)
+    assert device_update[DA.CURRENT_TEMPERATURE] == 25.54
+
+    event_data["relays"][0]["mode"] = "SCHEDULE"  # schedule_set_point is "OFF"
+    device_update = WebSocketMessageHandler.process_base_info(event_data, "1111111111")
+    assert device_update[DA.TARGET_TEMPERATURE] is None
+
+
+def test_handle_websocket_message_accepts_bytes():
+    """Test that binary frames are parsed without decoding and other namespaces are ignored."""
+    payload = b'["data",{"serial_number":"1111111111"}]'
+
+    result = WebSocketMessageHandler.handle_websocket_message(b"42/devices," + payload)
+    assert result == (False, ["data", {"serial_number": "1111111111"}])
+
+    assert WebSocketMessageHandler.handle_websocket_message(b"42/other," + payload) is None